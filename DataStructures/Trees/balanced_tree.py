@@ -34,6 +34,9 @@ class BalancedTree(MyBinaryTree):
     Attributes:
         root: The root node of the tree
     """
+    # Insertion here does not follow the base class's level-order
+    # discipline, so shape checks cannot rely on the node count.
+    _LEVEL_ORDER_COMPLETE = False
     
     def __init__(self) -> None:
         """Initialize an empty balanced tree."""
@@ -112,6 +115,7 @@ class BalancedTree(MyBinaryTree):
             raise ValueError("Cannot insert None value into tree")
         
         self.root = self._insert_recursive_balanced(self.root, value)
+        self._version += 1
     
     def _insert_recursive_balanced(self, node: Optional[TreeNode], value: Any) -> TreeNode:
         """Recursively insert a value and maintain balance.
@@ -171,6 +175,7 @@ class BalancedTree(MyBinaryTree):
             raise EmptyTreeError("Cannot delete from empty tree")
         
         self.root = self._delete_recursive_balanced(self.root, value)
+        self._version += 1
     
     def _delete_recursive_balanced(self, node: Optional[TreeNode], value: Any) -> Optional[TreeNode]:
         """Recursively delete a value and maintain balance.
@@ -45,6 +45,9 @@ class BinarySearchTree(MyBinaryTree):
     Attributes:
         root: The root node of the tree
     """
+    # Insertion here does not follow the base class's level-order
+    # discipline, so shape checks cannot rely on the node count.
+    _LEVEL_ORDER_COMPLETE = False
     
     def __init__(self) -> None:
         """Initialize an empty binary search tree."""
@@ -70,6 +73,7 @@ class BinarySearchTree(MyBinaryTree):
             self.root = TreeNode(value)
         else:
             self._insert_recursive(self.root, value)
+        self._version += 1
     
     def _insert_recursive(self, node: TreeNode, value: Any) -> None:
         """Recursively insert a value while maintaining BST properties.
@@ -146,6 +150,7 @@ class BinarySearchTree(MyBinaryTree):
             raise EmptyTreeError("Cannot delete from empty tree")
         
         self.root = self._delete_recursive(self.root, value)
+        self._version += 1
     
     def _delete_recursive(self, node: Optional[TreeNode], value: Any) -> Optional[TreeNode]:
         """Recursively delete a value while maintaining BST properties.
@@ -38,6 +38,9 @@ class CompleteBinaryTree(MyBinaryTree):
     Attributes:
         root: The root node of the tree
     """
+    # Insertion here does not follow the base class's level-order
+    # discipline, so shape checks cannot rely on the node count.
+    _LEVEL_ORDER_COMPLETE = False
     
     def __init__(self) -> None:
         """Initialize an empty complete binary tree."""
@@ -62,6 +65,7 @@ class CompleteBinaryTree(MyBinaryTree):
             self.root = TreeNode(value)
         else:
             self._insert_level_order(value)
+        self._version += 1
     
     def _insert_level_order(self, value: Any) -> None:
         """Insert a value using level-order traversal to maintain complete property.
@@ -102,6 +106,7 @@ class CompleteBinaryTree(MyBinaryTree):
         if not self.root.left and not self.root.right:
             value = self.root.value
             self.root = None
+            self._version += 1
             return value
         
         queue: Deque[TreeNode] = deque([self.root])
@@ -127,6 +132,7 @@ class CompleteBinaryTree(MyBinaryTree):
                 last_parent.right = None
             else:
                 last_parent.left = None
+            self._version += 1
             return value
         
         return None
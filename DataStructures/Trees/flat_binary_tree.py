@@ -0,0 +1,329 @@
+"""A complete binary tree stored as a flat array.
+
+This module implements the same level-order tree that MyBinaryTree builds,
+but stores it in a single Python list using the heap indexing convention
+(left child of index i is 2i+1, right child is 2i+2). Because MyBinaryTree's
+insertion discipline keeps the tree complete at all times, no pointers are
+needed: every structural query becomes index arithmetic, every traversal is
+a walk over a contiguous list, and insert/delete collapse to list append/pop.
+
+This is the layout memory allocators such as Netty's PoolChunk use for their
+buddy trees, and it is the fastest representation available for the
+level-order code path: zero node allocations and full cache-line utilisation.
+
+Example:
+    >>> tree = FlatBinaryTree()
+    >>> tree.insert(1)
+    >>> tree.insert(2)
+    >>> tree.insert(3)
+    >>> print(tree.traverse_level_order())
+    [1, 2, 3]
+    >>> print(tree.is_perfect())
+    True
+"""
+
+from typing import Any, List
+
+from my_binary_tree import EmptyTreeError
+
+
+class FlatBinaryTree:
+    """A complete binary tree backed by a flat list.
+
+    This class mirrors MyBinaryTree's public interface for the operations
+    that make sense on a complete tree, but replaces the linked TreeNode
+    representation with a single list indexed by the heap convention.
+    It is intentionally a standalone class rather than a MyBinaryTree
+    subclass: there are no nodes to inherit behaviour for.
+
+    Compared to the pointer-based tree:
+    - insert/delete-last are O(1) list operations
+    - level-order traversal is a list copy
+    - shape queries (height, is_perfect, is_full) are O(1) arithmetic
+    - find_min/find_max are C-level min()/max() calls
+
+    Attributes:
+        values: The underlying list, in level-order
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty flat binary tree."""
+        self.values: List[Any] = []
+
+    def __len__(self) -> int:
+        """Return the number of nodes in the tree."""
+        return len(self.values)
+
+    def insert(self, value: Any) -> None:
+        """Insert a value at the next level-order position.
+
+        Args:
+            value: The value to insert
+
+        Raises:
+            ValueError: If the value is None
+
+        Time Complexity:
+            O(1) amortized
+        """
+        if value is None:
+            raise ValueError("Cannot insert None value into tree")
+        self.values.append(value)
+
+    def delete(self, value: Any) -> None:
+        """Delete a value, replacing it with the last level-order node.
+
+        Args:
+            value: The value to delete
+
+        Raises:
+            EmptyTreeError: If the tree is empty
+
+        Time Complexity:
+            O(n) for the search, O(1) for the removal
+        """
+        values = self.values
+        if not values:
+            raise EmptyTreeError("Cannot delete from empty tree")
+        try:
+            index = values.index(value)
+        except ValueError:
+            return
+        values[index] = values[-1]
+        values.pop()
+
+    def contains(self, value: Any) -> bool:
+        """Check if a value exists in the tree.
+
+        Args:
+            value: The value to search for
+
+        Returns:
+            True if the value exists, False otherwise
+        """
+        return value in self.values
+
+    def height(self) -> int:
+        """Return the height of the tree.
+
+        A complete tree over n nodes always has height floor(log2 n),
+        so no traversal is needed.
+
+        Returns:
+            The height of the tree, or -1 if the tree is empty
+        """
+        return len(self.values).bit_length() - 1
+
+    def count_nodes(self) -> int:
+        """Return the total number of nodes in the tree."""
+        return len(self.values)
+
+    def count_leaves(self) -> int:
+        """Return the number of leaf nodes in the tree.
+
+        In a complete tree over n nodes, indices n//2 .. n-1 are leaves.
+
+        Returns:
+            The number of leaf nodes
+        """
+        count = len(self.values)
+        return count - count // 2
+
+    def is_balanced(self) -> bool:
+        """Check if the tree is balanced.
+
+        A complete tree is balanced by construction.
+
+        Returns:
+            True, always
+        """
+        return True
+
+    def is_full(self) -> bool:
+        """Check if the tree is a full binary tree.
+
+        A complete tree has at most one single-child node, and it exists
+        exactly when the node count is even.
+
+        Returns:
+            True if every node has 0 or 2 children
+        """
+        count = len(self.values)
+        return count == 0 or count & 1 == 1
+
+    def is_perfect(self) -> bool:
+        """Check if the tree is a perfect binary tree.
+
+        A complete tree is perfect exactly when its node count is one
+        less than a power of two.
+
+        Returns:
+            True if the tree is perfect, False otherwise
+        """
+        count = len(self.values)
+        return count == 0 or (count + 1) & count == 0
+
+    def find_min(self) -> Any:
+        """Return the minimum value in the tree.
+
+        Raises:
+            EmptyTreeError: If the tree is empty
+        """
+        if not self.values:
+            raise EmptyTreeError("Cannot find minimum of empty tree")
+        return min(self.values)
+
+    def find_max(self) -> Any:
+        """Return the maximum value in the tree.
+
+        Raises:
+            EmptyTreeError: If the tree is empty
+        """
+        if not self.values:
+            raise EmptyTreeError("Cannot find maximum of empty tree")
+        return max(self.values)
+
+    def traverse_level_order(self) -> List[Any]:
+        """Return a list of values in level-order traversal.
+
+        Returns:
+            A copy of the backing list, which is already in level order
+        """
+        return list(self.values)
+
+    def traverse_inorder(self) -> List[Any]:
+        """Return a list of values in inorder traversal.
+
+        Returns:
+            A list of values in inorder traversal
+        """
+        values = self.values
+        count = len(values)
+        result: List[Any] = []
+        out = result.append
+        stack: List[int] = []
+        push = stack.append
+        pop = stack.pop
+
+        index = 0
+        while stack or index < count:
+            while index < count:
+                push(index)
+                index = 2 * index + 1
+            index = pop()
+            out(values[index])
+            index = 2 * index + 2
+        return result
+
+    def traverse_preorder(self) -> List[Any]:
+        """Return a list of values in preorder traversal.
+
+        Returns:
+            A list of values in preorder traversal
+        """
+        values = self.values
+        count = len(values)
+        result: List[Any] = []
+        out = result.append
+        stack: List[int] = [0] if count else []
+        push = stack.append
+        pop = stack.pop
+
+        while stack:
+            index = pop()
+            out(values[index])
+            right = 2 * index + 2
+            if right < count:
+                push(right)
+            if right - 1 < count:
+                push(right - 1)
+        return result
+
+    def traverse_postorder(self) -> List[Any]:
+        """Return a list of values in postorder traversal.
+
+        Returns:
+            A list of values in postorder traversal
+        """
+        values = self.values
+        count = len(values)
+        result: List[Any] = []
+        out = result.append
+        stack: List[int] = [0] if count else []
+        push = stack.append
+        pop = stack.pop
+
+        while stack:
+            index = pop()
+            out(values[index])
+            left = 2 * index + 1
+            if left < count:
+                push(left)
+            if left + 1 < count:
+                push(left + 1)
+        result.reverse()
+        return result
+
+    def clear(self) -> None:
+        """Remove all nodes from the tree."""
+        self.values.clear()
+
+    def __str__(self) -> str:
+        """Return a string representation of the tree's level order."""
+        if not self.values:
+            return "Empty Tree"
+        return "FlatBinaryTree(" + ", ".join(map(str, self.values)) + ")"
+
+    def __repr__(self) -> str:
+        """Return a detailed string representation of the tree."""
+        return (f"FlatBinaryTree(height={self.height()}, "
+                f"nodes={self.count_nodes()}, "
+                f"leaves={self.count_leaves()}, "
+                f"perfect={self.is_perfect()})")
+
+
+if __name__ == "__main__":
+    # Test the flat binary tree against the pointer-based base class
+    from my_binary_tree import MyBinaryTree
+
+    flat = FlatBinaryTree()
+    linked = MyBinaryTree()
+
+    print("Testing insertion:")
+    for val in range(1, 11):
+        flat.insert(val)
+        linked.insert(val)
+    print("Level order:", flat.traverse_level_order())
+    print("Matches linked tree?",
+          flat.traverse_level_order() == linked.traverse_level_order())
+
+    print("\nTesting traversals against the linked tree:")
+    print("Inorder matches?",
+          flat.traverse_inorder() == linked.traverse_inorder())
+    print("Preorder matches?",
+          flat.traverse_preorder() == linked.traverse_preorder())
+    print("Postorder matches?",
+          flat.traverse_postorder() == linked.traverse_postorder())
+
+    print("\nTesting shape queries:")
+    print("Height:", flat.height())
+    print("Is perfect?", flat.is_perfect())
+    print("Is full?", flat.is_full())
+    print("Leaf nodes:", flat.count_leaves())
+    print("Min:", flat.find_min(), "Max:", flat.find_max())
+
+    print("\nTesting deletion:")
+    flat.delete(3)
+    print("After deleting 3:", flat.traverse_level_order())
+
+    print("\nTesting error handling:")
+    empty = FlatBinaryTree()
+    try:
+        empty.delete(5)
+    except EmptyTreeError as e:
+        print("Caught EmptyTreeError:", e)
+
+    try:
+        flat.insert(None)
+    except ValueError as e:
+        print("Caught ValueError:", e)
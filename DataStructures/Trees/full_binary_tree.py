@@ -43,10 +43,14 @@ class FullBinaryTree(MyBinaryTree):
     Attributes:
         root: The root node of the tree
     """
+    # Insertion here does not follow the base class's level-order
+    # discipline, so shape checks cannot rely on the node count.
+    _LEVEL_ORDER_COMPLETE = False
     
     def __init__(self) -> None:
         """Initialize an empty full binary tree."""
         super().__init__()
+        self._stats: Optional[Tuple[int, Tuple[bool, int, int, List[Any]]]] = None
     
     def insert(self, value: Any) -> None:
         """Insert a value into the tree while maintaining full property.
@@ -68,6 +72,7 @@ class FullBinaryTree(MyBinaryTree):
             self.root = TreeNode(value)
         else:
             self._insert_maintaining_full_property(value)
+        self._version += 1
     
     def _insert_maintaining_full_property(self, value: Any) -> None:
         """Insert a value while maintaining the full binary tree property.
@@ -82,20 +87,21 @@ class FullBinaryTree(MyBinaryTree):
         
         while queue:
             node = queue.popleft()
-            
+            left, right = node.left, node.right
+
             # If node has no children, create both children
-            if not node.left and not node.right:
+            if not left and not right:
                 node.left = TreeNode(value)
                 node.right = TreeNode(value)  # Using same value for both children
                 return
-            
+
             # If node has one child, this is invalid for a full binary tree
-            if (node.left and not node.right) or (not node.left and node.right):
+            if (left and not right) or (not left and right):
                 raise InvalidNodeError("Cannot insert into a node with only one child")
-            
+
             # If node has two children, continue searching
-            queue.append(node.left)
-            queue.append(node.right)
+            queue.append(left)
+            queue.append(right)
     
     def delete(self, value: Any) -> None:
         """Delete a value from the tree while maintaining full property.
@@ -125,19 +131,22 @@ class FullBinaryTree(MyBinaryTree):
                 node_to_delete = current_node
                 parent = parent_node
                 break
-            
-            if current_node.left:
-                queue.append((current_node, current_node.left))
-            if current_node.right:
-                queue.append((current_node, current_node.right))
+
+            left, right = current_node.left, current_node.right
+            if left:
+                queue.append((current_node, left))
+            if right:
+                queue.append((current_node, right))
         
         if not node_to_delete:
             return
-        
+
+        self._version += 1
+
         # If the node to delete is a leaf, we can safely remove it
         if not node_to_delete.left and not node_to_delete.right:
             if parent:
-                if parent.left == node_to_delete:
+                if parent.left is node_to_delete:
                     parent.left = None
                 else:
                     parent.right = None
@@ -147,71 +156,76 @@ class FullBinaryTree(MyBinaryTree):
         
         # If the node has children, we need to delete the entire subtree
         if parent:
-            if parent.left == node_to_delete:
+            if parent.left is node_to_delete:
                 parent.left = None
             else:
                 parent.right = None
         else:
             self.root = None
     
+    def tree_stats(self) -> Tuple[bool, int, int, List[Any]]:
+        """Compute fullness, node counts and leaf values in one traversal.
+
+        The result is cached and reused until the tree is mutated, so the
+        individual accessors below cost a single fused pass per tree version
+        instead of one full walk each.
+
+        Returns:
+            A tuple (is_full, internal_nodes, leaf_nodes, leaf_values)
+        """
+        if self._stats is not None and self._stats[0] == self._version:
+            return self._stats[1]
+
+        is_full = True
+        internal = 0
+        leaf_values: List[Any] = []
+        stack = [self.root]
+
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+
+            left, right = node.left, node.right
+            if not left and not right:
+                leaf_values.append(node.value)
+            else:
+                internal += 1
+                if not (left and right):
+                    is_full = False
+                stack.append(right)
+                stack.append(left)
+
+        stats = (is_full, internal, len(leaf_values), leaf_values)
+        self._stats = (self._version, stats)
+        return stats
+
     def is_full(self) -> bool:
         """Check if the tree is a full binary tree.
-        
+
         Returns:
             True if the tree is full, False otherwise
         """
-        def check_node(node: Optional[TreeNode]) -> bool:
-            if not node:
-                return True
-            
-            # If node is a leaf
-            if not node.left and not node.right:
-                return True
-            
-            # If node has exactly two children
-            if node.left and node.right:
-                return check_node(node.left) and check_node(node.right)
-            
-            # If node has only one child
-            return False
-        
-        return check_node(self.root)
-    
+        return self.tree_stats()[0]
+
     def count_internal_nodes(self) -> int:
         """Return the number of internal nodes in the tree.
-        
+
         An internal node is a node that has at least one child.
-        
+
         Returns:
             The number of internal nodes
         """
-        def count(node: Optional[TreeNode]) -> int:
-            if not node:
-                return 0
-            
-            if not node.left and not node.right:
-                return 0
-            
-            return 1 + count(node.left) + count(node.right)
-        
-        return count(self.root)
-    
+        return self.tree_stats()[1]
+
     def get_leaf_values(self) -> List[Any]:
         """Return a list of values stored in leaf nodes.
-        
+
         Returns:
             A list of values stored in leaf nodes
         """
-        def get_leaves(node: Optional[TreeNode]) -> List[Any]:
-            if not node:
-                return []
-            
-            if not node.left and not node.right:
-                return [node.value]
-            
-            return get_leaves(node.left) + get_leaves(node.right)
-        
-        return get_leaves(self.root)
+        # Hand out a copy so caller mutations cannot poison the cache.
+        return list(self.tree_stats()[3])
 
 
 if __name__ == "__main__":
@@ -43,33 +43,44 @@ class TreeNode:
         value: The value stored in the node
         left: Reference to the left child node
         right: Reference to the right child node
+        height: Cached subtree height, maintained by trees that memoize it
     """
-    
+
+    __slots__ = ('value', 'left', 'right', 'height')
+
     def __init__(self, value: Any) -> None:
         """Initialize a tree node with a value.
-        
+
         Args:
             value: The value to store in the node
         """
         self.value = value
         self.left: Optional[TreeNode] = None
         self.right: Optional[TreeNode] = None
+        self.height: int = 0
     
     def __str__(self) -> str:
-        """Return a string representation of the node.
-        
+        """Return a compact string representation of the node.
+
+        Kept cheap on purpose: repr() is often called in tight debug loops,
+        and the child links are available via describe() when needed.
+
         Returns:
-            A string showing the node's value and its children
+            A string showing only the node's value
         """
-        return f"TreeNode(value={self.value}, left={self.left.value if self.left else None}, right={self.right.value if self.right else None})"
-    
-    def __repr__(self) -> str:
-        """Return a detailed string representation of the node.
-        
+        return f"TreeNode({self.value!r})"
+
+    __repr__ = __str__
+
+    def describe(self) -> str:
+        """Return a verbose description including both child values.
+
         Returns:
             A string showing the node's value and its children
         """
-        return self.__str__()
+        return (f"TreeNode(value={self.value}, "
+                f"left={self.left.value if self.left else None}, "
+                f"right={self.right.value if self.right else None})")
 
 
 class MyBinaryTree:
@@ -88,11 +99,23 @@ class MyBinaryTree:
     
     Attributes:
         root: The root node of the tree
+        _version: Counter bumped on every mutation, used to invalidate caches
+        _traverse_cache: Cached traversal results keyed by traversal kind
+        _count: Number of nodes, maintained by insert/delete
     """
-    
+
+    # Base-class insertion is strictly level-order, so the tree is always
+    # complete and shape checks can be answered from the node count alone.
+    # Subclasses with different insertion disciplines set this to False.
+    _LEVEL_ORDER_COMPLETE = True
+
     def __init__(self) -> None:
         """Initialize an empty binary tree."""
         self.root: Optional[TreeNode] = None
+        self._version: int = 0
+        self._traverse_cache: dict = {}
+        self._count: int = 0
+        self._node_pool: List[TreeNode] = []
     
     def insert(self, value: Any) -> None:
         """Insert a value into the tree.
@@ -110,32 +133,87 @@ class MyBinaryTree:
             raise ValueError("Cannot insert None value into tree")
         
         if not self.root:
-            self.root = TreeNode(value)
-        else:
+            self.root = self._make_node(value)
+        elif self._LEVEL_ORDER_COMPLETE:
             self._insert_level_order(value)
-    
+        else:
+            self._insert_first_free(value)
+        self._count += 1
+        self._version += 1
+
+    def _make_node(self, value: Any) -> TreeNode:
+        """Return a node holding value, reusing a pooled node when possible.
+
+        Recycling nodes freed by deletions avoids allocator and GC churn
+        during insert/delete heavy workloads.
+
+        Args:
+            value: The value to store in the node
+
+        Returns:
+            A fresh or recycled TreeNode
+        """
+        pool = self._node_pool
+        if pool:
+            node = pool.pop()
+            node.value = value
+            return node
+        return TreeNode(value)
+
+    def _recycle_node(self, node: TreeNode) -> None:
+        """Return a detached node to the pool for reuse.
+
+        Args:
+            node: The node to recycle; must already be unlinked from the tree
+        """
+        node.value = None
+        node.left = None
+        node.right = None
+        self._node_pool.append(node)
+
     def _insert_level_order(self, value: Any) -> None:
-        """Insert a value using level-order traversal.
-        
+        """Insert a value at the next free level-order position.
+
+        Because insertion is strictly level-order, the path from the root to
+        the next free slot is the binary representation of the new node's
+        1-based index (0 bit = left, 1 bit = right after the leading bit), so
+        the descent costs O(log n) instead of a full BFS.
+
+        Args:
+            value: The value to insert
+        """
+        index = self._count + 1  # 1-based index of the new node
+        node = self.root
+        for shift in range(index.bit_length() - 2, 0, -1):
+            node = node.right if (index >> shift) & 1 else node.left
+
+        if index & 1:
+            node.right = self._make_node(value)
+        else:
+            node.left = self._make_node(value)
+
+    def _insert_first_free(self, value: Any) -> None:
+        """Insert a value at the first free child slot in level order.
+
+        Fallback for trees whose shape is no longer guaranteed complete
+        (e.g. after mirror_inplace), where the count-indexed descent
+        would land on an occupied slot and overwrite a live child.
+
         Args:
             value: The value to insert
         """
         queue: Deque[TreeNode] = deque([self.root])
-        
         while queue:
             node = queue.popleft()
-            
-            if not node.left:
-                node.left = TreeNode(value)
+            if node.left is None:
+                node.left = self._make_node(value)
                 return
-            
-            if not node.right:
-                node.right = TreeNode(value)
+            if node.right is None:
+                node.right = self._make_node(value)
                 return
-            
             queue.append(node.left)
             queue.append(node.right)
-    
+
     def delete(self, value: Any) -> None:
         """Delete a value from the tree.
         
@@ -150,65 +228,53 @@ class MyBinaryTree:
         """
         if not self.root:
             raise EmptyTreeError("Cannot delete from empty tree")
-        
-        # Find the node to delete and the last node
+
+        # One BFS finds the node to delete and the last node's parent link,
+        # so disconnecting the last node at the end is O(1) instead of a
+        # second traversal.
         node_to_delete = None
-        last_node = None
+        last_node = self.root
+        last_parent = None
+        last_was_right = False
         queue: Deque[TreeNode] = deque([self.root])
-        
+        push = queue.append
+        popleft = queue.popleft
+
         while queue:
-            node = queue.popleft()
-            
+            node = popleft()
+
             if node.value == value:
                 node_to_delete = node
-            
-            if node.left:
-                queue.append(node.left)
-            if node.right:
-                queue.append(node.right)
-            
-            last_node = node
-        
+
+            left, right = node.left, node.right
+            if left:
+                push(left)
+                last_node = left
+                last_parent = node
+                last_was_right = False
+            if right:
+                push(right)
+                last_node = right
+                last_parent = node
+                last_was_right = True
+
         if not node_to_delete:
             return
-        
-        # Replace the value of the node to delete with the last node's value
+
+        self._version += 1
+
+        # Replace the value of the node to delete with the last node's value,
+        # then unlink the last node.
         node_to_delete.value = last_node.value
-        
-        # Delete the last node
-        self._delete_last()
-    
-    def _delete_last(self) -> None:
-        """Delete the last node in level-order traversal."""
-        if not self.root:
-            return
-        
-        if not self.root.left and not self.root.right:
+
+        if last_parent is None:
             self.root = None
-            return
-        
-        queue: Deque[TreeNode] = deque([self.root])
-        last_parent = None
-        last_node = None
-        
-        while queue:
-            node = queue.popleft()
-            
-            if node.left:
-                last_parent = node
-                last_node = node.left
-                queue.append(node.left)
-            
-            if node.right:
-                last_parent = node
-                last_node = node.right
-                queue.append(node.right)
-        
-        if last_node:
-            if last_parent.right == last_node:
-                last_parent.right = None
-            else:
-                last_parent.left = None
+        elif last_was_right:
+            last_parent.right = None
+        else:
+            last_parent.left = None
+        self._recycle_node(last_node)
+        self._count -= 1
     
     def contains(self, value: Any) -> bool:
         """Check if a value exists in the tree.
@@ -229,12 +295,13 @@ class MyBinaryTree:
             
             if node.value == value:
                 return True
-            
-            if node.left:
-                queue.append(node.left)
-            if node.right:
-                queue.append(node.right)
-        
+
+            left, right = node.left, node.right
+            if left:
+                queue.append(left)
+            if right:
+                queue.append(right)
+
         return False
     
     def traverse_inorder(self) -> List[Any]:
@@ -243,12 +310,28 @@ class MyBinaryTree:
         Returns:
             A list of values in inorder traversal
         """
-        def inorder(node: Optional[TreeNode]) -> List[Any]:
-            if not node:
-                return []
-            return inorder(node.left) + [node.value] + inorder(node.right)
-        
-        return inorder(self.root)
+        cached = self._traverse_cache.get("inorder")
+        if cached is not None and cached[0] == self._version:
+            # Hand out a copy so caller mutations cannot poison the cache.
+            return list(cached[1])
+
+        result: List[Any] = []
+        stack: List[TreeNode] = []
+        node = self.root
+        out = result.append
+        push = stack.append
+        pop = stack.pop
+
+        while node or stack:
+            while node:
+                push(node)
+                node = node.left
+            node = pop()
+            out(node.value)
+            node = node.right
+
+        self._traverse_cache["inorder"] = (self._version, result)
+        return list(result)
     
     def traverse_preorder(self) -> List[Any]:
         """Return a list of values in preorder traversal.
@@ -256,12 +339,27 @@ class MyBinaryTree:
         Returns:
             A list of values in preorder traversal
         """
-        def preorder(node: Optional[TreeNode]) -> List[Any]:
-            if not node:
-                return []
-            return [node.value] + preorder(node.left) + preorder(node.right)
-        
-        return preorder(self.root)
+        cached = self._traverse_cache.get("preorder")
+        if cached is not None and cached[0] == self._version:
+            # Hand out a copy so caller mutations cannot poison the cache.
+            return list(cached[1])
+
+        result: List[Any] = []
+        stack: List[Optional[TreeNode]] = [self.root]
+        out = result.append
+        push = stack.append
+        pop = stack.pop
+
+        while stack:
+            node = pop()
+            if node is None:
+                continue
+            out(node.value)
+            push(node.right)
+            push(node.left)
+
+        self._traverse_cache["preorder"] = (self._version, result)
+        return list(result)
     
     def traverse_postorder(self) -> List[Any]:
         """Return a list of values in postorder traversal.
@@ -269,12 +367,30 @@ class MyBinaryTree:
         Returns:
             A list of values in postorder traversal
         """
-        def postorder(node: Optional[TreeNode]) -> List[Any]:
-            if not node:
-                return []
-            return postorder(node.left) + postorder(node.right) + [node.value]
-        
-        return postorder(self.root)
+        cached = self._traverse_cache.get("postorder")
+        if cached is not None and cached[0] == self._version:
+            # Hand out a copy so caller mutations cannot poison the cache.
+            return list(cached[1])
+
+        # Two-stack trick: a reversed preorder (node, right, left) drained
+        # from the second stack yields postorder (left, right, node).
+        visit: List[Optional[TreeNode]] = [self.root]
+        output: List[TreeNode] = []
+        out = output.append
+        push = visit.append
+        pop = visit.pop
+
+        while visit:
+            node = pop()
+            if node is None:
+                continue
+            out(node)
+            push(node.left)
+            push(node.right)
+
+        result = [node.value for node in reversed(output)]
+        self._traverse_cache["postorder"] = (self._version, result)
+        return list(result)
     
     def traverse_level_order(self) -> List[Any]:
         """Return a list of values in level-order traversal.
@@ -287,16 +403,20 @@ class MyBinaryTree:
         
         result: List[Any] = []
         queue: Deque[TreeNode] = deque([self.root])
-        
+        out = result.append
+        push = queue.append
+        popleft = queue.popleft
+
         while queue:
-            node = queue.popleft()
-            result.append(node.value)
-            
-            if node.left:
-                queue.append(node.left)
-            if node.right:
-                queue.append(node.right)
-        
+            node = popleft()
+            out(node.value)
+
+            left, right = node.left, node.right
+            if left:
+                push(left)
+            if right:
+                push(right)
+
         return result
     
     def height(self) -> int:
@@ -305,12 +425,23 @@ class MyBinaryTree:
         Returns:
             The height of the tree (number of edges in the longest path)
         """
-        def get_height(node: Optional[TreeNode]) -> int:
-            if not node:
-                return -1
-            return 1 + max(get_height(node.left), get_height(node.right))
-        
-        return get_height(self.root)
+        if not self.root:
+            return -1
+
+        height = -1
+        queue: Deque[TreeNode] = deque([self.root])
+
+        while queue:
+            height += 1
+            for _ in range(len(queue)):
+                node = queue.popleft()
+                left, right = node.left, node.right
+                if left:
+                    queue.append(left)
+                if right:
+                    queue.append(right)
+
+        return height
     
     def is_balanced(self) -> bool:
         """Check if the tree is balanced.
@@ -321,42 +452,58 @@ class MyBinaryTree:
         Returns:
             True if the tree is balanced, False otherwise
         """
-        def check_balance(node: Optional[TreeNode]) -> Tuple[bool, int]:
-            if not node:
-                return True, -1
-            
-            left_balanced, left_height = check_balance(node.left)
-            right_balanced, right_height = check_balance(node.right)
-            
-            is_balanced = (left_balanced and right_balanced and
-                         abs(left_height - right_height) <= 1)
-            height = 1 + max(left_height, right_height)
-            
-            return is_balanced, height
-        
-        return check_balance(self.root)[0]
+        # Iterative postorder: children are processed before their parent,
+        # so each subtree height is known when the parent is revisited.
+        heights: dict = {None: -1}
+        stack: List[Tuple[Optional[TreeNode], bool]] = [(self.root, False)]
+
+        while stack:
+            node, processed = stack.pop()
+            if node is None:
+                continue
+
+            if processed:
+                left_height = heights[node.left]
+                right_height = heights[node.right]
+                if abs(left_height - right_height) > 1:
+                    return False
+                heights[node] = 1 + (left_height if left_height > right_height
+                                     else right_height)
+            else:
+                stack.append((node, True))
+                stack.append((node.left, False))
+                stack.append((node.right, False))
+
+        return True
     
     def is_full(self) -> bool:
         """Check if the tree is a full binary tree.
         
         A full binary tree is a tree in which every node has either 0 or 2 children.
-        
+
+        The check walks an explicit stack and returns False at the first
+        one-child node it sees, so non-full trees are usually rejected after
+        touching only a few nodes and deep trees never hit the recursion
+        limit.
+
         Returns:
             True if the tree is full, False otherwise
         """
-        def check_full(node: Optional[TreeNode]) -> bool:
-            if not node:
-                return True
-            
-            if not node.left and not node.right:
-                return True
-            
-            if node.left and node.right:
-                return check_full(node.left) and check_full(node.right)
-            
-            return False
-        
-        return check_full(self.root)
+        stack: List[Optional[TreeNode]] = [self.root]
+        pop = stack.pop
+        push = stack.append
+
+        while stack:
+            node = pop()
+            if node is None:
+                continue
+            left, right = node.left, node.right
+            if (left is None) != (right is None):
+                return False
+            if left:
+                push(left)
+                push(right)
+        return True
     
     def is_perfect(self) -> bool:
         """Check if the tree is a perfect binary tree.
@@ -367,21 +514,36 @@ class MyBinaryTree:
         Returns:
             True if the tree is perfect, False otherwise
         """
-        def check_perfect(node: Optional[TreeNode], depth: int, level: int) -> bool:
-            if not node:
-                return True
-            
-            if not node.left and not node.right:
-                return depth == level
-            
-            if not node.left or not node.right:
-                return False
-            
-            return (check_perfect(node.left, depth, level + 1) and
-                   check_perfect(node.right, depth, level + 1))
-        
-        depth = self.height()
-        return check_perfect(self.root, depth, 0)
+        if self._LEVEL_ORDER_COMPLETE:
+            # A complete tree is perfect exactly when it has 2^(h+1) - 1
+            # nodes, i.e. count + 1 is a power of two.
+            count = self._count
+            return count == 0 or (count + 1) & count == 0
+
+        if not self.root:
+            return True
+
+        queue: Deque[Tuple[TreeNode, int]] = deque([(self.root, 0)])
+        leaf_depth = -1
+
+        while queue:
+            node, depth = queue.popleft()
+            left, right = node.left, node.right
+
+            if not left and not right:
+                if leaf_depth == -1:
+                    leaf_depth = depth
+                elif depth != leaf_depth:
+                    return False
+            else:
+                # An internal node after the first leaf, or with a single
+                # child, rules the tree out immediately.
+                if not (left and right) or leaf_depth != -1:
+                    return False
+                queue.append((left, depth + 1))
+                queue.append((right, depth + 1))
+
+        return True
     
     def count_nodes(self) -> int:
         """Return the total number of nodes in the tree.
@@ -389,12 +551,18 @@ class MyBinaryTree:
         Returns:
             The total number of nodes
         """
-        def count(node: Optional[TreeNode]) -> int:
-            if not node:
-                return 0
-            return 1 + count(node.left) + count(node.right)
-        
-        return count(self.root)
+        total = 0
+        stack: List[Optional[TreeNode]] = [self.root]
+
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            total += 1
+            stack.append(node.left)
+            stack.append(node.right)
+
+        return total
     
     def count_leaves(self) -> int:
         """Return the number of leaf nodes in the tree.
@@ -402,16 +570,23 @@ class MyBinaryTree:
         Returns:
             The number of leaf nodes
         """
-        def count(node: Optional[TreeNode]) -> int:
-            if not node:
-                return 0
-            
-            if not node.left and not node.right:
-                return 1
-            
-            return count(node.left) + count(node.right)
-        
-        return count(self.root)
+        if not self.root:
+            return 0
+
+        total = 0
+        stack: List[TreeNode] = [self.root]
+
+        while stack:
+            node = stack.pop()
+            left, right = node.left, node.right
+            # Branchless accumulate: a leaf contributes exactly 1.
+            total += (left is None) & (right is None)
+            if left:
+                stack.append(left)
+            if right:
+                stack.append(right)
+
+        return total
     
     def find_min(self) -> Optional[Any]:
         """Find the minimum value in the tree.
@@ -424,16 +599,21 @@ class MyBinaryTree:
         
         min_value = self.root.value
         queue: Deque[TreeNode] = deque([self.root])
-        
+        popleft = queue.popleft
+        append = queue.append
+
         while queue:
-            node = queue.popleft()
-            min_value = min(min_value, node.value)
-            
-            if node.left:
-                queue.append(node.left)
-            if node.right:
-                queue.append(node.right)
-        
+            node = popleft()
+            value = node.value
+            if value < min_value:
+                min_value = value
+
+            left, right = node.left, node.right
+            if left:
+                append(left)
+            if right:
+                append(right)
+
         return min_value
     
     def find_max(self) -> Optional[Any]:
@@ -447,50 +627,149 @@ class MyBinaryTree:
         
         max_value = self.root.value
         queue: Deque[TreeNode] = deque([self.root])
-        
+        popleft = queue.popleft
+        append = queue.append
+
         while queue:
-            node = queue.popleft()
-            max_value = max(max_value, node.value)
-            
-            if node.left:
-                queue.append(node.left)
-            if node.right:
-                queue.append(node.right)
-        
+            node = popleft()
+            value = node.value
+            if value > max_value:
+                max_value = value
+
+            left, right = node.left, node.right
+            if left:
+                append(left)
+            if right:
+                append(right)
+
         return max_value
     
+    def tree_summary(self) -> Tuple[Optional[Any], Optional[Any], int, int, int]:
+        """Compute min, max, node count, leaf count and height in one pass.
+
+        A single level-order traversal gathers all five statistics, so
+        callers that need several of them pay one tree walk instead of one
+        per accessor. The result is cached until the tree is mutated.
+
+        Returns:
+            A tuple (min_value, max_value, node_count, leaf_count, height)
+        """
+        cached = self._traverse_cache.get("summary")
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+
+        if not self.root:
+            summary = (None, None, 0, 0, -1)
+            self._traverse_cache["summary"] = (self._version, summary)
+            return summary
+
+        min_value = max_value = self.root.value
+        nodes = 0
+        leaves = 0
+        height = -1
+        queue: Deque[TreeNode] = deque([self.root])
+
+        while queue:
+            height += 1
+            for _ in range(len(queue)):
+                node = queue.popleft()
+                nodes += 1
+
+                value = node.value
+                if value < min_value:
+                    min_value = value
+                elif value > max_value:
+                    max_value = value
+
+                left, right = node.left, node.right
+                if not left and not right:
+                    leaves += 1
+                else:
+                    if left:
+                        queue.append(left)
+                    if right:
+                        queue.append(right)
+
+        summary = (min_value, max_value, nodes, leaves, height)
+        self._traverse_cache["summary"] = (self._version, summary)
+        return summary
+
     def mirror(self) -> None:
         """Create a mirror image of the tree.
-        
+
         This method swaps the left and right children of every node in the tree.
         """
-        def mirror_node(node: Optional[TreeNode]) -> None:
-            if not node:
-                return
-            
+        self.mirror_inplace()
+
+    def mirror_inplace(self) -> None:
+        """Mirror the tree in place without allocating any new nodes.
+
+        This method swaps the left and right children of every node using a
+        single iterative pass, avoiding both recursion and node allocation.
+        """
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
             node.left, node.right = node.right, node.left
-            mirror_node(node.left)
-            mirror_node(node.right)
-        
-        mirror_node(self.root)
+            stack.append(node.left)
+            stack.append(node.right)
+        self._version += 1
+        # Mirroring right-aligns the bottom level, so a complete tree
+        # stays complete only when that level is full (i.e. the tree is
+        # perfect). Otherwise the count-indexed insert descent no longer
+        # matches the shape and insert must fall back to the BFS scan.
+        count = self._count
+        if self._LEVEL_ORDER_COMPLETE and (count + 1) & count != 0:
+            self._LEVEL_ORDER_COMPLETE = False
     
     def copy_deep(self) -> 'MyBinaryTree':
         """Create a deep copy of the tree.
-        
+
         Returns:
-            A new tree that is a deep copy of the current tree
+            A new tree of the same class that is a deep copy of this one
         """
-        def copy_node(node: Optional[TreeNode]) -> Optional[TreeNode]:
-            if not node:
-                return None
-            
-            new_node = TreeNode(node.value)
-            new_node.left = copy_node(node.left)
-            new_node.right = copy_node(node.right)
-            return new_node
-        
-        new_tree = MyBinaryTree()
-        new_tree.root = copy_node(self.root)
+        # Instantiating type(self) keeps subclass copies under their own
+        # insertion discipline instead of reverting to level-order.
+        new_tree = type(self)()
+        if not self.root:
+            return new_tree
+
+        new_tree.root = TreeNode(self.root.value)
+        # Carry the memoized subtree heights across: trees that maintain
+        # them (UnbalancedTree) would otherwise trust the default zeros
+        # on the copy. A no-op for every class that never reads height.
+        new_tree.root.height = self.root.height
+        count = 1
+
+        # Parallel source/destination stacks avoid allocating a pair tuple
+        # per visited node.
+        src_stack: List[TreeNode] = [self.root]
+        dst_stack: List[TreeNode] = [new_tree.root]
+
+        while src_stack:
+            src = src_stack.pop()
+            dst = dst_stack.pop()
+            left, right = src.left, src.right
+            if left:
+                dst.left = TreeNode(left.value)
+                dst.left.height = left.height
+                src_stack.append(left)
+                dst_stack.append(dst.left)
+                count += 1
+            if right:
+                dst.right = TreeNode(right.value)
+                dst.right.height = right.height
+                src_stack.append(right)
+                dst_stack.append(dst.right)
+                count += 1
+
+        # Count the nodes as they are cloned: subclasses do not maintain
+        # _count, so copying self._count would hand subclass copies a
+        # stale zero and re-enable the count-based fast paths on it.
+        new_tree._count = count
+        new_tree._LEVEL_ORDER_COMPLETE = self._LEVEL_ORDER_COMPLETE
         return new_tree
     
     def equals(self, other: 'MyBinaryTree') -> bool:
@@ -504,18 +783,30 @@ class MyBinaryTree:
         Returns:
             True if the trees are equal, False otherwise
         """
-        def check_equals(node1: Optional[TreeNode], node2: Optional[TreeNode]) -> bool:
-            if not node1 and not node2:
-                return True
-            
-            if not node1 or not node2:
+        # Trees that maintain their node count can disagree in O(1).
+        if (self._LEVEL_ORDER_COMPLETE and other._LEVEL_ORDER_COMPLETE
+                and self._count != other._count):
+            return False
+
+        stack1 = [self.root]
+        stack2 = [other.root]
+
+        while stack1:
+            node1 = stack1.pop()
+            node2 = stack2.pop()
+
+            if node1 is None and node2 is None:
+                continue
+
+            if node1 is None or node2 is None or node1.value != node2.value:
                 return False
-            
-            return (node1.value == node2.value and
-                   check_equals(node1.left, node2.left) and
-                   check_equals(node1.right, node2.right))
-        
-        return check_equals(self.root, other.root)
+
+            stack1.append(node1.left)
+            stack2.append(node2.left)
+            stack1.append(node1.right)
+            stack2.append(node2.right)
+
+        return True
     
     def __str__(self) -> str:
         """Return a string representation of the tree.
@@ -15,7 +15,7 @@ Example:
     False  # May be unbalanced depending on insertion order
 """
 
-from typing import Optional, Any
+from typing import Optional, Any, Iterable
 from my_binary_tree import MyBinaryTree, TreeNode, EmptyTreeError
 
 
@@ -36,6 +36,9 @@ class UnbalancedTree(MyBinaryTree):
     Attributes:
         root: The root node of the tree
     """
+    # Insertion here does not follow the base class's level-order
+    # discipline, so shape checks cannot rely on the node count.
+    _LEVEL_ORDER_COMPLETE = False
     
     def __init__(self) -> None:
         """Initialize an empty unbalanced tree."""
@@ -59,26 +62,122 @@ class UnbalancedTree(MyBinaryTree):
         if not self.root:
             self.root = TreeNode(value)
         else:
-            self._insert_recursive(self.root, value)
-    
-    def _insert_recursive(self, node: TreeNode, value: Any) -> None:
-        """Recursively insert a value without balancing.
-        
+            self._insert_iterative(value)
+        self._version += 1
+
+    def _insert_iterative(self, value: Any) -> None:
+        """Insert a value with a tight descent loop, without balancing.
+
+        Walking down with a loop instead of recursion avoids a Python frame
+        per level, which matters most on the skewed trees this class can
+        degenerate into.
+
         Args:
-            node: The current node being processed
             value: The value to insert
         """
-        if value < node.value:
-            if node.left:
-                self._insert_recursive(node.left, value)
-            else:
-                node.left = TreeNode(value)
-        else:
-            if node.right:
-                self._insert_recursive(node.right, value)
+        node = self.root
+        path = []
+        while True:
+            path.append(node)
+            if value < node.value:
+                child = node.left
+                if child is None:
+                    node.left = TreeNode(value)
+                    break
             else:
-                node.right = TreeNode(value)
+                child = node.right
+                if child is None:
+                    node.right = TreeNode(value)
+                    break
+            node = child
+
+        self._update_heights(path)
+
+    @staticmethod
+    def _update_heights(path: list) -> None:
+        """Refresh cached heights bottom-up along an insertion path.
+
+        Stops as soon as a node's height is unchanged, so the common cost is
+        far below the path length.
+
+        Args:
+            path: Nodes from the root down to the parent of the new node
+        """
+        for node in reversed(path):
+            left, right = node.left, node.right
+            left_height = left.height if left else -1
+            right_height = right.height if right else -1
+            new_height = 1 + (left_height if left_height > right_height
+                              else right_height)
+            if node.height == new_height:
+                return
+            node.height = new_height
     
+    def is_balanced(self) -> bool:
+        """Check if the tree is balanced using memoized subtree heights.
+
+        Insert and delete keep each node's cached height current, so the
+        check reads stored heights instead of recomputing every subtree
+        height per query.
+
+        Returns:
+            True if the tree is balanced, False otherwise
+        """
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            left, right = node.left, node.right
+            left_height = left.height if left else -1
+            right_height = right.height if right else -1
+            if abs(left_height - right_height) > 1:
+                return False
+            stack.append(left)
+            stack.append(right)
+        return True
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[Any]) -> 'UnbalancedTree':
+        """Build a tree from an iterable, producing a balanced BST.
+
+        Sorting once and attaching medians top-down costs O(n log n) total
+        and yields a tree of minimal height, instead of the O(n^2) worst
+        case (and skewed result) of inserting a sorted sequence one by one.
+
+        Args:
+            values: The values to build the tree from
+
+        Returns:
+            A new tree containing all the values, balanced by construction
+        """
+        tree = cls()
+        ordered = sorted(values)
+        if not ordered:
+            return tree
+
+        # Each stack entry is (lo, hi, parent, is_left_child).
+        stack = [(0, len(ordered) - 1, None, False)]
+        while stack:
+            lo, hi, parent, is_left = stack.pop()
+            if lo > hi:
+                continue
+            mid = (lo + hi) // 2
+            node = TreeNode(ordered[mid])
+            # A median-built subtree over n values has height floor(log2 n).
+            node.height = (hi - lo + 1).bit_length() - 1
+            if parent is None:
+                tree.root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            stack.append((lo, mid - 1, node, True))
+            stack.append((mid + 1, hi, node, False))
+
+        tree._version += 1
+        return tree
+
     def delete(self, value: Any) -> None:
         """Delete a value from the tree without balancing.
         
@@ -95,6 +194,7 @@ class UnbalancedTree(MyBinaryTree):
             raise EmptyTreeError("Cannot delete from empty tree")
         
         self.root = self._delete_recursive(self.root, value)
+        self._version += 1
     
     def _delete_recursive(self, node: Optional[TreeNode], value: Any) -> Optional[TreeNode]:
         """Recursively delete a value without balancing.
@@ -130,7 +230,12 @@ class UnbalancedTree(MyBinaryTree):
             
             # Delete the inorder successor
             node.right = self._delete_recursive(node.right, temp.value)
-        
+
+        left, right = node.left, node.right
+        left_height = left.height if left else -1
+        right_height = right.height if right else -1
+        node.height = 1 + (left_height if left_height > right_height
+                           else right_height)
         return node
 
 
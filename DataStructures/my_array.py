@@ -1,8 +1,15 @@
-"""A low-level array implementation in Python using ctypes.
+"""A low-level array implementation in Python.
 
 This module provides a dynamic array implementation that mimics the behavior
 of low-level arrays while providing dynamic resizing capabilities. The array
 automatically grows when needed and provides efficient O(1) access to elements.
+The backing store is a fixed-size Python list managed with an explicit
+capacity/length pair, which keeps the low-level resize mechanics visible while
+getting the C-level speed of list indexing and slicing. The element-shift and
+scan loops in insert/delete/find are expressed as slice assignments and
+index() calls rather than Python-level loops, so they already run as single
+C memmove/memcmp-style primitives; JIT compilation of those kernels would
+add a dependency without moving them off the C fast path.
 
 Features:
 - Dynamic resizing
@@ -21,16 +28,14 @@ Example:
     >>> print(arr)  # Output: [1, 3, 2]
 """
 
-from typing import Iterator, TypeVar, Generic
-import ctypes
-from dataclasses import dataclass
+from array import array
+from typing import Iterator, List, Optional, TypeVar, Generic
 
 T = TypeVar('T')
 
-@dataclass
 class ArrayError(Exception):
     """Base exception class for array operations."""
-    message: str
+    pass
 
 class IndexOutOfBoundsError(ArrayError):
     """Raised when an index is out of bounds."""
@@ -41,27 +46,32 @@ class EmptyArrayError(ArrayError):
     pass
 
 class MyArray(Generic[T]):
-    """A low-level array implementation using ctypes.
-    
+    """A low-level array implementation backed by a fixed-size list.
+
     This class provides a dynamic array implementation that automatically
-    resizes when needed. It uses ctypes for low-level memory management
-    and provides type-safe operations.
-    
+    resizes when needed. Slots beyond the current length are kept as None,
+    mirroring uninitialized memory in a real array.
+
     Attributes:
         capacity: The current capacity of the array
         length: The current number of elements in the array
-        data: The underlying ctypes array
+        data: The underlying fixed-size list
     
     Type Parameters:
         T: The type of elements stored in the array
     """
     
-    def __init__(self, capacity: int = 2) -> None:
+    def __init__(self, capacity: int = 2, typecode: Optional[str] = None) -> None:
         """Initialize an empty array with the given capacity.
-        
+
         Args:
             capacity: Initial capacity of the array (default: 2)
-            
+            typecode: Optional array.array typecode (e.g. 'q' for int64,
+                'd' for float64). When given, elements are stored unboxed
+                in a typed buffer instead of a list of object pointers,
+                cutting memory several-fold and keeping the data
+                contiguous for C-level scans.
+
         Raises:
             ValueError: If capacity is less than 1
         """
@@ -69,18 +79,50 @@ class MyArray(Generic[T]):
             raise ValueError("Capacity must be at least 1")
         self.capacity = capacity
         self.length = 0
+        self.typecode = typecode
+        # Typed buffers cannot hold None, so unused slots are zero there.
+        self._fill = None if typecode is None else 0
         self.data = self._make_array(capacity)
-    
-    def _make_array(self, size: int) -> ctypes.Array:
-        """Create a new ctypes array of the given size.
-        
+
+    @classmethod
+    def from_iterable(cls, values, typecode: Optional[str] = None) -> 'MyArray[T]':
+        """Build an array from an iterable in one bulk fill.
+
+        The backing store is created directly from the iterable at C
+        level, so bulk construction skips the per-element append calls
+        (and their capacity checks) entirely. This is the preferred way
+        to build a MyArray from existing data.
+
+        Args:
+            values: The values to populate the array with
+            typecode: Optional array.array typecode, as in __init__
+
+        Returns:
+            A new array containing all the values
+        """
+        self = cls.__new__(cls)
+        self.typecode = typecode
+        self._fill = None if typecode is None else 0
+        self.data = list(values) if typecode is None else array(typecode, values)
+        self.length = len(self.data)
+        self.capacity = max(self.length, 2)
+        if self.length < self.capacity:
+            self.data.extend([self._fill] * (self.capacity - self.length))
+        return self
+
+    def _make_array(self, size: int):
+        """Create a new backing store of the given size.
+
         Args:
             size: The size of the array to create
-            
+
         Returns:
-            A new ctypes array of the specified size
+            A new filler-padded list, or a typed array when a typecode
+            was configured
         """
-        return (size * ctypes.py_object)()
+        if self.typecode is None:
+            return [None] * size
+        return array(self.typecode, [0] * size)
     
     def __len__(self) -> int:
         """Return the number of elements in the array.
@@ -102,8 +144,9 @@ class MyArray(Generic[T]):
         Raises:
             IndexOutOfBoundsError: If the index is out of bounds
         """
-        if not 0 <= index < self.length:
-            raise IndexOutOfBoundsError(f"Index {index} out of bounds [0, {self.length})")
+        length = self.length
+        if index < 0 or index >= length:
+            raise IndexOutOfBoundsError(f"Index {index} out of bounds [0, {length})")
         return self.data[index]
     
     def __setitem__(self, index: int, value: T) -> None:
@@ -116,38 +159,77 @@ class MyArray(Generic[T]):
         Raises:
             IndexOutOfBoundsError: If the index is out of bounds
         """
-        if not 0 <= index < self.length:
-            raise IndexOutOfBoundsError(f"Index {index} out of bounds [0, {self.length})")
+        length = self.length
+        if index < 0 or index >= length:
+            raise IndexOutOfBoundsError(f"Index {index} out of bounds [0, {length})")
         self.data[index] = value
     
     def append(self, value: T) -> None:
         """Append an element to the end of the array.
-        
-        If the array is full, it will be resized to double its current capacity.
-        
+
+        If the array is full, it will be resized to 1.5x its current capacity.
+
         Args:
             value: The value to append
             
         Time Complexity:
             O(1) amortized
         """
-        if self.length == self.capacity:
+        length = self.length
+        if length == self.capacity:
             self._resize()
-        self.data[self.length] = value
-        self.length += 1
+        self.data[length] = value
+        self.length = length + 1
     
     def _resize(self) -> None:
-        """Double the capacity of the array and copy existing elements.
-        
+        """Grow the capacity of the array by a factor of 1.5.
+
+        A 1.5x factor keeps append amortized O(1) while wasting less peak
+        memory than doubling, and freed blocks from earlier growths can be
+        reused by later ones (the sum of previous sizes exceeds the next
+        size, which is never true with factor 2).
+
         Time Complexity:
             O(n) where n is the current length
         """
-        new_capacity = self.capacity * 2
-        new_data = self._make_array(new_capacity)
-        for i in range(self.length):
-            new_data[i] = self.data[i]
-        self.data = new_data
+        # capacity >> 1 is 0 for capacity 1, so force at least one extra slot.
+        self._resize_to(max(self.capacity + (self.capacity >> 1), self.capacity + 1))
+
+    def _resize_to(self, new_capacity: int) -> None:
+        """Grow the backing store to an exact capacity.
+
+        Args:
+            new_capacity: The new capacity; must be >= the current length
+
+        Time Complexity:
+            O(n) where n is the current length
+        """
+        # Growing the existing store in place avoids allocating a second
+        # full-size buffer and copying every element across.
+        self.data.extend([self._fill] * (new_capacity - self.capacity))
         self.capacity = new_capacity
+
+    def extend(self, values) -> None:
+        """Append all values from an iterable with at most one resize.
+
+        Sizing the backing store once up front and copying with a single
+        slice assignment avoids the per-call capacity check and dispatch
+        cost of repeated append calls.
+
+        Args:
+            values: The values to append
+
+        Time Complexity:
+            O(k) amortized, where k is the number of values
+        """
+        vals = values if hasattr(values, '__len__') else list(values)
+        needed = self.length + len(vals)
+        if needed > self.capacity:
+            self._resize_to(max(self.capacity + (self.capacity >> 1), needed))
+        if self.typecode is not None and not isinstance(vals, array):
+            vals = array(self.typecode, vals)
+        self.data[self.length:needed] = vals
+        self.length = needed
     
     def insert(self, index: int, value: T) -> None:
         """Insert an element at the specified index.
@@ -162,18 +244,23 @@ class MyArray(Generic[T]):
         Time Complexity:
             O(n) where n is the current length
         """
-        if not 0 <= index <= self.length:
-            raise IndexOutOfBoundsError(f"Index {index} out of bounds [0, {self.length}]")
-        
-        if self.length == self.capacity:
+        length = self.length
+        if index < 0 or index > length:
+            raise IndexOutOfBoundsError(f"Index {index} out of bounds [0, {length}]")
+
+        # Inserting at the end is just an append; skip the empty shift.
+        if index == length:
+            self.append(value)
+            return
+
+        if length == self.capacity:
             self._resize()
-        
-        # Shift elements to make space
-        for i in range(self.length, index, -1):
-            self.data[i] = self.data[i - 1]
-        
+
+        # Shift elements to make space with one bulk slice copy
+        self.data[index + 1:length + 1] = self.data[index:length]
+
         self.data[index] = value
-        self.length += 1
+        self.length = length + 1
     
     def delete(self, index: int) -> None:
         """Delete the element at the specified index.
@@ -187,15 +274,17 @@ class MyArray(Generic[T]):
         Time Complexity:
             O(n) where n is the current length
         """
-        if not 0 <= index < self.length:
-            raise IndexOutOfBoundsError(f"Index {index} out of bounds [0, {self.length})")
-        
-        # Shift elements to fill the gap
-        for i in range(index, self.length - 1):
-            self.data[i] = self.data[i + 1]
-        
-        self.data[self.length - 1] = None
-        self.length -= 1
+        length = self.length
+        if index < 0 or index >= length:
+            raise IndexOutOfBoundsError(f"Index {index} out of bounds [0, {length})")
+
+        # Deleting the last element needs no shift at all.
+        if index != length - 1:
+            # Shift elements to fill the gap with one bulk slice copy
+            self.data[index:length - 1] = self.data[index + 1:length]
+
+        self.data[length - 1] = self._fill
+        self.length = length - 1
     
     def pop(self) -> T:
         """Remove and return the last element of the array.
@@ -213,7 +302,7 @@ class MyArray(Generic[T]):
             raise EmptyArrayError("Cannot pop from empty array")
         
         value = self.data[self.length - 1]
-        self.data[self.length - 1] = None
+        self.data[self.length - 1] = self._fill
         self.length -= 1
         return value
     
@@ -229,10 +318,12 @@ class MyArray(Generic[T]):
         Time Complexity:
             O(n) where n is the current length
         """
-        for i in range(self.length):
-            if self.data[i] == value:
-                return i
-        return -1
+        # Materialize the live slice once and let list.index do the scan at
+        # C level instead of comparing element by element in Python.
+        try:
+            return self.data[:self.length].index(value)
+        except ValueError:
+            return -1
     
     def clear(self) -> None:
         """Remove all elements from the array.
@@ -272,7 +363,7 @@ class MyArray(Generic[T]):
         Returns:
             A string showing the array's contents
         """
-        return f"MyArray([{', '.join(repr(self.data[i]) for i in range(self.length))}])"
+        return f"MyArray([{', '.join(map(repr, self.data[:self.length]))}])"
     
     def __str__(self) -> str:
         """Return a string representation of the array.
@@ -280,7 +371,7 @@ class MyArray(Generic[T]):
         Returns:
             A string showing the array's contents
         """
-        return "[" + ", ".join(str(self.data[i]) for i in range(self.length)) + "]"
+        return "[" + ", ".join(map(str, self.data[:self.length])) + "]"
 
 
 if __name__ == "__main__":
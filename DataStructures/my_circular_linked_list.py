@@ -1,12 +1,16 @@
-"""A circular linked list implementation.
+"""A circular doubly linked list implementation.
 
 This module provides a circular linked list implementation with comprehensive
 features and type safety. The linked list uses a sentinel node for efficient
-operations and maintains a circular structure.
+operations and maintains a circular structure. Nodes carry both next and prev
+pointers, which makes the tail reachable in O(1) through the sentinel and
+lets reverse() complete in O(1) by flipping a direction flag instead of
+rewriting every link.
 
 Features:
-- O(1) prepend operations
-- O(n) append and search operations
+- O(1) append and prepend operations via the sentinel's prev pointer
+- O(1) reverse via a lazy direction flag
+- O(n) search operations
 - Sentinel node for efficient operations
 - Type safety with type hints
 - Comprehensive error handling
@@ -24,14 +28,12 @@ Example:
 """
 
 from typing import TypeVar, Generic, Optional, Iterator, Tuple
-from dataclasses import dataclass
 
 T = TypeVar('T')
 
-@dataclass
 class CircularLinkedListError(Exception):
     """Base exception class for circular linked list operations."""
-    message: str
+    pass
 
 class IndexOutOfBoundsError(CircularLinkedListError):
     """Raised when an index is out of bounds."""
@@ -43,287 +45,402 @@ class EmptyListError(CircularLinkedListError):
 
 class Node(Generic[T]):
     """A node in the circular linked list.
-    
+
     Attributes:
         value: The value stored in the node
         next: Reference to the next node
+        prev: Reference to the previous node
     """
+
+    # next comes first: it is the field every traversal step reads, and
+    # slot layout follows declaration order, keeping it adjacent to the
+    # object header on the hot cache line.
+    __slots__ = ('next', 'prev', 'value')
+
     def __init__(self, value: Optional[T] = None) -> None:
         """Initialize a new node.
-        
+
         Args:
             value: The value to store in the node (optional for sentinel node)
         """
         self.value = value
         self.next: Optional[Node[T]] = None
+        self.prev: Optional[Node[T]] = None
 
 class MyCircularLinkedList(Generic[T]):
-    """A circular linked list implementation.
-    
+    """A circular doubly linked list implementation.
+
     This class provides a circular linked list implementation using a sentinel
     node for efficient operations. It supports generic types and provides
     comprehensive error handling.
-    
+
+    The list is doubly linked, so the last node is always the sentinel's
+    prev neighbour and no tail pointer needs to be maintained. Reversal is
+    lazy: a direction flag decides whether traversals follow next or prev
+    pointers, so reverse() is O(1) and every other operation consults the
+    flag to present the logical order.
+
     Attributes:
         sentinel: A sentinel node that marks the start/end of the list
         _size: Current number of elements
-        _iter_node: Current node for iteration
-    
+        _reversed: Whether the logical order follows prev pointers
+
     Type Parameters:
         T: The type of elements stored in the list
     """
-    
+
     def __init__(self) -> None:
         """Initialize an empty circular linked list with a sentinel node."""
         self.sentinel = Node[T]()  # Sentinel node (valueless)
-        self.sentinel.next = self.sentinel  # Points to itself
+        self.sentinel.next = self.sentinel  # Points to itself both ways
+        self.sentinel.prev = self.sentinel
         self._size: int = 0
-        self._iter_node: Optional[Node[T]] = None  # For iteration
-    
+        self._reversed: bool = False
+
+    @property
+    def tail(self) -> Node[T]:
+        """The last node in logical order (the sentinel when empty)."""
+        return self.sentinel.next if self._reversed else self.sentinel.prev
+
+    def _insert_between(self, value: T, left: Node[T], right: Node[T]) -> Node[T]:
+        """Link a new node between two physically adjacent nodes.
+
+        Args:
+            value: The value to store in the new node
+            left: The node that will physically precede the new node
+            right: The node that will physically follow the new node
+
+        Returns:
+            The newly created node
+        """
+        node = Node(value)
+        node.prev = left
+        node.next = right
+        left.next = node
+        right.prev = node
+        self._size += 1
+        return node
+
     def append(self, value: T) -> None:
         """Append an element to the end of the list.
-        
+
+        The sentinel's prev pointer always references the physical last
+        node, so no walk is needed.
+
         Args:
             value: The value to append
-            
+
         Time Complexity:
-            O(n) where n is the number of elements
+            O(1)
         """
-        new_node = Node(value)
-        current = self.sentinel
-        while current.next != self.sentinel:
-            current = current.next
-        current.next = new_node
-        new_node.next = self.sentinel
-        self._size += 1
-    
+        sentinel = self.sentinel
+        if self._reversed:
+            # Logical end is the physical front when reversed.
+            self._insert_between(value, sentinel, sentinel.next)
+        else:
+            self._insert_between(value, sentinel.prev, sentinel)
+
     def prepend(self, value: T) -> None:
         """Prepend an element to the start of the list.
-        
+
         Args:
             value: The value to prepend
-            
+
         Time Complexity:
             O(1)
         """
-        new_node = Node(value)
-        new_node.next = self.sentinel.next
-        self.sentinel.next = new_node
-        self._size += 1
-    
+        sentinel = self.sentinel
+        if self._reversed:
+            self._insert_between(value, sentinel.prev, sentinel)
+        else:
+            self._insert_between(value, sentinel, sentinel.next)
+
     def delete(self, value: T) -> bool:
         """Delete the first occurrence of a value from the list.
-        
+
         Args:
             value: The value to delete
-            
+
         Returns:
             True if the value was found and deleted, False otherwise
-            
+
         Time Complexity:
             O(n) where n is the number of elements
         """
-        prev = self.sentinel
-        current = self.sentinel.next
-        while current != self.sentinel:
+        sentinel = self.sentinel
+        forward = not self._reversed
+        current = sentinel.next if forward else sentinel.prev
+        while current is not sentinel:
             if current.value == value:
-                prev.next = current.next
+                # Unlinking needs no predecessor tracking with prev links.
+                current.prev.next = current.next
+                current.next.prev = current.prev
                 self._size -= 1
                 return True
-            prev = current
-            current = current.next
+            current = current.next if forward else current.prev
         return False
-    
+
     def reverse(self) -> None:
         """Reverse the list in place.
-        
+
+        Only flips the direction flag; traversals then follow prev
+        pointers instead of next pointers.
+
         Time Complexity:
-            O(n) where n is the number of elements
+            O(1)
+        """
+        self._reversed = not self._reversed
+
+    def _normalize(self) -> None:
+        """Materialize a pending lazy reversal into the physical links.
+
+        Operations that re-splice the ring (rotate) are much simpler on a
+        list whose physical order matches its logical order, so they call
+        this first. O(n) only when a reversal is actually pending.
         """
-        prev = self.sentinel
-        current = self.sentinel.next
-        while current != self.sentinel:
-            next_node = current.next
-            current.next = prev
-            prev = current
-            current = next_node
-        self.sentinel.next = prev
-    
+        if not self._reversed:
+            return
+        sentinel = self.sentinel
+        node = sentinel
+        while True:
+            node.next, node.prev = node.prev, node.next
+            node = node.next
+            if node is sentinel:
+                break
+        self._reversed = False
+
     def kth_from_end(self, k: int) -> T:
         """Find the k-th element from the end of the list.
-        
+
         Args:
             k: The position from the end (1-based)
-            
+
         Returns:
             The value at the k-th position from the end
-            
+
         Raises:
             IndexOutOfBoundsError: If k is invalid
             EmptyListError: If the list is empty
-            
+
         Time Complexity:
-            O(n) where n is the number of elements
+            O(min(k, n - k))
         """
         if self.is_empty():
             raise EmptyListError("Cannot find kth element in empty list")
-        
+
         if k <= 0 or k > self._size:
             raise IndexOutOfBoundsError(f"Invalid k: {k}")
-        
-        slow = self.sentinel.next
-        fast = self.sentinel.next
-        for _ in range(k):
-            fast = fast.next
-        while fast != self.sentinel:
-            slow = slow.next
-            fast = fast.next
-        return slow.value
-    
+
+        # With prev pointers both ends are reachable, so walk in from
+        # whichever end is nearer to index size - k.
+        index = self._size - k
+        sentinel = self.sentinel
+        forward = not self._reversed
+        if index <= self._size // 2:
+            node = sentinel.next if forward else sentinel.prev
+            for _ in range(index):
+                node = node.next if forward else node.prev
+        else:
+            node = sentinel.prev if forward else sentinel.next
+            for _ in range(self._size - 1 - index):
+                node = node.prev if forward else node.next
+        return node.value
+
     def find_middle(self) -> T:
         """Find the middle element of the list.
-        
+
         Returns:
             The middle element (second middle if even length)
-            
+
         Raises:
             EmptyListError: If the list is empty
-            
+
         Time Complexity:
             O(n) where n is the number of elements
         """
         if self.is_empty():
             raise EmptyListError("Cannot find middle of empty list")
-        
-        slow = self.sentinel.next
-        fast = self.sentinel.next
-        while fast != self.sentinel and fast.next != self.sentinel:
-            slow = slow.next
-            fast = fast.next.next
-        return slow.value
-    
+
+        # Walk straight to index size // 2 using the tracked size.
+        forward = not self._reversed
+        node = self.sentinel.next if forward else self.sentinel.prev
+        for _ in range(self._size // 2):
+            node = node.next if forward else node.prev
+        return node.value
+
     def split(self) -> Tuple['MyCircularLinkedList[T]', 'MyCircularLinkedList[T]']:
         """Split the list into two halves.
-        
+
         Returns:
             A tuple containing two new circular linked lists
-            
+
         Raises:
             ValueError: If the list is too small to split
-            
+
         Time Complexity:
             O(n) where n is the number of elements
         """
         if self._size < 2:
             raise ValueError("List too small to split")
-        
+
         mid_index = self._size // 2
         first_half = MyCircularLinkedList[T]()
         second_half = MyCircularLinkedList[T]()
-        
-        current = self.sentinel.next
+
+        # Thread cloned nodes directly onto each half, the same way
+        # copy_deep does, instead of paying an append call per element.
+        sentinel = self.sentinel
+        forward = not self._reversed
+        current = sentinel.next if forward else sentinel.prev
+
+        prev = first_half.sentinel
         for _ in range(mid_index):
-            first_half.append(current.value)
-            current = current.next
+            clone = Node(current.value)
+            clone.prev = prev
+            prev.next = clone
+            prev = clone
+            current = current.next if forward else current.prev
+        prev.next = first_half.sentinel
+        first_half.sentinel.prev = prev
+        first_half._size = mid_index
+
+        prev = second_half.sentinel
         for _ in range(self._size - mid_index):
-            second_half.append(current.value)
-            current = current.next
-        
+            clone = Node(current.value)
+            clone.prev = prev
+            prev.next = clone
+            prev = clone
+            current = current.next if forward else current.prev
+        prev.next = second_half.sentinel
+        second_half.sentinel.prev = prev
+        second_half._size = self._size - mid_index
+
         return first_half, second_half
-    
+
     def rotate(self, k: int) -> None:
         """Rotate the list k positions to the left.
-        
+
         Args:
             k: Number of positions to rotate
-            
+
         Time Complexity:
-            O(n) where n is the number of elements
+            O(k), after materializing any pending lazy reversal
         """
         if self._size == 0 or k % self._size == 0:
             return
-        
+
+        self._normalize()
+
         k = k % self._size
-        current = self.sentinel.next
-        for _ in range(k - 1):
-            current = current.next
-        new_head = current.next
-        current.next = self.sentinel
-        last = new_head
-        while last.next != self.sentinel:
-            last = last.next
-        last.next = new_head
-        self.sentinel.next = new_head
-    
+        # Walk to the new head from whichever end is nearer.
+        sentinel = self.sentinel
+        if k <= self._size // 2:
+            new_head = sentinel.next
+            for _ in range(k):
+                new_head = new_head.next
+        else:
+            new_head = sentinel
+            for _ in range(self._size - k):
+                new_head = new_head.prev
+
+        old_head = sentinel.next
+        old_tail = sentinel.prev
+        new_tail = new_head.prev
+
+        # Close the ring over the old seam, then cut it open before the
+        # new head. Four pointer writes regardless of list size.
+        old_tail.next = old_head
+        old_head.prev = old_tail
+        sentinel.next = new_head
+        new_head.prev = sentinel
+        new_tail.next = sentinel
+        sentinel.prev = new_tail
+
     def copy_deep(self) -> 'MyCircularLinkedList[T]':
         """Create a deep copy of the list.
-        
+
+        Clones nodes directly while walking the source once, instead of
+        going through the iterator protocol and an append call per
+        element.
+
         Returns:
             A new circular linked list with the same elements
-            
+
         Time Complexity:
             O(n) where n is the number of elements
         """
         new_list = MyCircularLinkedList[T]()
-        for value in self:
-            new_list.append(value)
+        new_sentinel = new_list.sentinel
+        prev = new_sentinel
+        sentinel = self.sentinel
+        forward = not self._reversed
+        node = sentinel.next if forward else sentinel.prev
+        while node is not sentinel:
+            clone = Node(node.value)
+            clone.prev = prev
+            prev.next = clone
+            prev = clone
+            node = node.next if forward else node.prev
+        prev.next = new_sentinel
+        new_sentinel.prev = prev
+        new_list._size = self._size
         return new_list
-    
+
     def size(self) -> int:
         """Get the number of elements in the list.
-        
+
         Returns:
             The current size of the list
-            
+
         Time Complexity:
             O(1)
         """
         return self._size
-    
+
     def is_empty(self) -> bool:
         """Check if the list is empty.
-        
+
         Returns:
             True if the list is empty, False otherwise
-            
+
         Time Complexity:
             O(1)
         """
         return self._size == 0
-    
+
     def __iter__(self) -> Iterator[T]:
         """Return an iterator over the elements of the list.
-        
+
+        Implemented as a generator so iteration state lives in locals
+        rather than on the instance, which makes nested or concurrent
+        iteration over the same list safe and keeps the per-element cost
+        to a pair of LOAD_FAST instructions.
+
         Returns:
             An iterator yielding each element in the list
         """
-        self._iter_node = self.sentinel.next
-        return self
-    
-    def __next__(self) -> T:
-        """Get the next element in the iteration.
-        
-        Returns:
-            The next element
-            
-        Raises:
-            StopIteration: If there are no more elements
-        """
-        if self._iter_node == self.sentinel:
-            raise StopIteration
-        value = self._iter_node.value
-        self._iter_node = self._iter_node.next
-        return value
-    
+        sentinel = self.sentinel
+        if self._reversed:
+            node = sentinel.prev
+            while node is not sentinel:
+                yield node.value
+                node = node.prev
+        else:
+            node = sentinel.next
+            while node is not sentinel:
+                yield node.value
+                node = node.next
+
     def __str__(self) -> str:
         """Return a string representation of the list.
-        
+
         Returns:
             A string showing the list's contents
         """
         if self.is_empty():
             return "Empty List"
-        return " -> ".join(str(val) for val in self) + " -> (head)"
+        parts = [str(value) for value in self]
+        return " -> ".join(parts) + " -> (head)"
 
 
 if __name__ == "__main__":
@@ -332,82 +449,82 @@ if __name__ == "__main__":
         # Create a circular linked list
         lst = MyCircularLinkedList[int]()
         print("Created empty circular linked list")
-        
+
         # Test append
         print("\nTesting append:")
         for i in range(1, 6):
             lst.append(i)
             print(f"Appended {i}: {lst}")
-        
+
         # Test prepend
         print("\nTesting prepend:")
         lst.prepend(0)
         print(f"Prepended 0: {lst}")
-        
+
         # Test delete
         print("\nTesting delete:")
         lst.delete(3)
         print(f"Deleted 3: {lst}")
-        
+
         # Test find_middle
         print("\nTesting find_middle:")
         print(f"Middle element: {lst.find_middle()}")
-        
+
         # Test kth_from_end
         print("\nTesting kth_from_end:")
         print(f"2nd from end: {lst.kth_from_end(2)}")
-        
+
         # Test reverse
         print("\nTesting reverse:")
         lst.reverse()
         print(f"Reversed: {lst}")
-        
+
         # Test split
         print("\nTesting split:")
         first, second = lst.split()
         print(f"First half: {first}")
         print(f"Second half: {second}")
-        
+
         # Test rotate
         print("\nTesting rotate:")
         lst.rotate(2)
         print(f"Rotated 2 times: {lst}")
-        
+
         # Test copy_deep
         print("\nTesting copy_deep:")
         copy = lst.copy_deep()
         print(f"Copy: {copy}")
-        
+
         # Test iteration
         print("\nTesting iteration:")
         print("Elements:", end=" ")
         for x in lst:
             print(x, end=" ")
         print()
-        
+
         # Test error handling
         print("\nTesting error handling:")
         try:
             lst.kth_from_end(10)  # Invalid k
         except IndexOutOfBoundsError as e:
             print(f"Expected error: {e}")
-        
+
         empty = MyCircularLinkedList[int]()
         try:
             empty.find_middle()  # Empty list
         except EmptyListError as e:
             print(f"Expected error: {e}")
-        
+
         try:
             empty.split()  # Too small to split
         except ValueError as e:
             print(f"Expected error: {e}")
-        
+
         # Test type safety
         print("\nTesting type safety:")
         try:
             lst.append("string")  # Type error
         except TypeError as e:
             print(f"Expected error: {e}")
-    
+
     test_circular_linked_list()
@@ -13,6 +13,13 @@ Features:
 - Efficient memory usage
 - Iterator support
 
+The nodes are deliberately real linked objects rather than indices into
+parallel value/next/prev arrays. The struct-of-arrays layout would make
+traversal cache-friendlier, but it turns every structural operation into
+index bookkeeping and stops teaching the pointer manipulation this module
+exists to demonstrate; the slotted, pooled nodes used here recover most of
+the memory overhead instead.
+
 Example:
     >>> lst = MyDoublyLinkedList[int]()
     >>> lst.append(1)
@@ -48,6 +55,9 @@ class Node(Generic[T]):
         prev: Reference to the previous node
         next: Reference to the next node
     """
+
+    __slots__ = ('value', 'prev', 'next')
+
     def __init__(self, value: T) -> None:
         """Initialize a new node.
         
@@ -74,47 +84,165 @@ class MyDoublyLinkedList(Generic[T]):
         T: The type of elements stored in the list
     """
     
+    # Retired nodes are kept for reuse up to this many, so add/remove
+    # heavy workloads stop hitting the allocator and GC entirely.
+    _POOL_LIMIT = 1024
+
     def __init__(self) -> None:
         """Initialize an empty doubly linked list."""
         self.head: Optional[Node[T]] = None
         self.tail: Optional[Node[T]] = None
         self._size: int = 0
-    
-    def append(self, value: T) -> None:
+        self._free: List[Node[T]] = []
+        # When True the list is logically reversed: head/tail have been
+        # swapped and every traversal follows prev where it would follow
+        # next (and vice versa). Flipping this flag is what makes
+        # reverse() O(1).
+        self._reversed: bool = False
+        # Occurrence counter per value, so delete can reject a missing
+        # value in O(1) instead of walking the whole list. Set to None
+        # the first time an unhashable value is stored, which disables
+        # the fast path but keeps the list fully general.
+        self._counts: Optional[dict] = {}
+
+    def _count_value(self, value: T) -> None:
+        """Record one more occurrence of value in the counter.
+
+        Args:
+            value: The value being inserted
+        """
+        counts = self._counts
+        if counts is not None:
+            try:
+                counts[value] = counts.get(value, 0) + 1
+            except TypeError:
+                self._counts = None
+
+    def _uncount_value(self, value: T) -> None:
+        """Record one fewer occurrence of value in the counter.
+
+        Args:
+            value: The value being removed
+        """
+        counts = self._counts
+        if counts is not None:
+            remaining = counts.get(value, 0) - 1
+            if remaining > 0:
+                counts[value] = remaining
+            else:
+                counts.pop(value, None)
+
+    def _new_node(self, value: T) -> Node[T]:
+        """Return a node holding value, reusing a pooled node when possible.
+
+        Args:
+            value: The value to store in the node
+
+        Returns:
+            A fresh or recycled node with cleared links
+        """
+        free = self._free
+        if free:
+            node = free.pop()
+            node.value = value
+            return node
+        return Node(value)
+
+    def _recycle_node(self, node: Node[T]) -> None:
+        """Return a detached node to the pool for reuse.
+
+        Args:
+            node: The node to recycle; must already be unlinked
+        """
+        if len(self._free) < self._POOL_LIMIT:
+            node.value = None
+            node.prev = None
+            node.next = None
+            self._free.append(node)
+
+    def append(self, value: T) -> Node[T]:
         """Append an element to the end of the list.
-        
+
         Args:
             value: The value to append
-            
+
+        Returns:
+            The new node, usable as a handle for delete_node
+
         Time Complexity:
             O(1)
         """
-        new_node = Node(value)
-        if not self.head:
+        new_node = self._new_node(value)
+        if self.head is None:
             self.head = self.tail = new_node
+        elif self._reversed:
+            self.tail.prev = new_node
+            new_node.next = self.tail
+            self.tail = new_node
         else:
             self.tail.next = new_node
             new_node.prev = self.tail
             self.tail = new_node
         self._size += 1
+        self._count_value(value)
+        return new_node
     
-    def prepend(self, value: T) -> None:
+    def prepend(self, value: T) -> Node[T]:
         """Prepend an element to the start of the list.
         
         Args:
             value: The value to prepend
-            
+
+        Returns:
+            The new node, usable as a handle for delete_node
+
         Time Complexity:
             O(1)
         """
-        new_node = Node(value)
-        if not self.head:
+        new_node = self._new_node(value)
+        if self.head is None:
             self.head = self.tail = new_node
+        elif self._reversed:
+            self.head.next = new_node
+            new_node.prev = self.head
+            self.head = new_node
         else:
             self.head.prev = new_node
             new_node.next = self.head
             self.head = new_node
         self._size += 1
+        self._count_value(value)
+        return new_node
+
+    def delete_node(self, node: Node[T]) -> None:
+        """Unlink a node directly, given its handle.
+
+        Callers that kept the node returned by append/prepend (the LRU
+        cache idiom) skip the O(n) search that delete(value) pays: both
+        neighbours are one pointer away. The node must belong to this
+        list; passing a foreign or already-removed node corrupts the
+        links.
+
+        Args:
+            node: The node to unlink
+
+        Time Complexity:
+            O(1)
+        """
+        prev_node = node.prev
+        next_node = node.next
+        if prev_node is not None:
+            prev_node.next = next_node
+        if next_node is not None:
+            next_node.prev = prev_node
+        reverse = self._reversed
+        if node is self.head:
+            self.head = prev_node if reverse else next_node
+        if node is self.tail:
+            self.tail = next_node if reverse else prev_node
+        self._size -= 1
+        self._uncount_value(node.value)
+        self._recycle_node(node)
     
     def delete(self, value: T) -> bool:
         """Delete the first occurrence of a value from the list.
@@ -126,27 +254,45 @@ class MyDoublyLinkedList(Generic[T]):
             True if the value was found and deleted, False otherwise
             
         Time Complexity:
-            O(n) where n is the number of elements
+            O(1) when the value is not present (and the counter is
+            active), O(n) otherwise
         """
-        if not self.head:
+        if self.head is None:
             return False
-        
+
+        # The counter settles the common miss case without touching a
+        # single node. An unhashable value raises TypeError on lookup
+        # and simply falls through to the walk.
+        counts = self._counts
+        if counts is not None:
+            try:
+                if counts.get(value, 0) == 0:
+                    return False
+            except TypeError:
+                pass
+
+        reverse = self._reversed
         current = self.head
-        while current:
+        while current is not None:
             if current.value == value:
-                if current.prev:  # Middle or tail node
-                    current.prev.next = current.next
-                else:  # Head node
-                    self.head = current.next
-                
-                if current.next:  # Middle or head node
-                    current.next.prev = current.prev
-                else:  # Tail node
-                    self.tail = current.prev
-                
+                prev_node = current.prev
+                next_node = current.next
+                # The physical unlink is symmetric; only the head/tail
+                # updates depend on which direction is logically forward.
+                if prev_node is not None:
+                    prev_node.next = next_node
+                if next_node is not None:
+                    next_node.prev = prev_node
+                if current is self.head:
+                    self.head = prev_node if reverse else next_node
+                if current is self.tail:
+                    self.tail = next_node if reverse else prev_node
+
                 self._size -= 1
+                self._uncount_value(current.value)
+                self._recycle_node(current)
                 return True
-            current = current.next
+            current = current.prev if reverse else current.next
         return False
     
     def find(self, value: T) -> int:
@@ -161,12 +307,13 @@ class MyDoublyLinkedList(Generic[T]):
         Time Complexity:
             O(n) where n is the number of elements
         """
+        reverse = self._reversed
         current = self.head
         index = 0
-        while current:
+        while current is not None:
             if current.value == value:
                 return index
-            current = current.next
+            current = current.prev if reverse else current.next
             index += 1
         return -1
     
@@ -194,20 +341,16 @@ class MyDoublyLinkedList(Generic[T]):
     
     def reverse(self) -> None:
         """Reverse the list in place.
-        
+
+        No node is touched: the endpoints are swapped and a direction
+        flag is flipped, and every traversal reads prev for next (and
+        vice versa) while the flag is set.
+
         Time Complexity:
-            O(n) where n is the number of elements
+            O(1)
         """
-        current = self.head
-        self.tail = current
-        prev = None
-        while current:
-            prev = current.prev
-            current.prev = current.next
-            current.next = prev
-            current = current.prev
-        if prev:
-            self.head = prev.prev
+        self.head, self.tail = self.tail, self.head
+        self._reversed = not self._reversed
     
     def insert_at(self, index: int, value: T) -> None:
         """Insert a value at the specified index.
@@ -218,31 +361,48 @@ class MyDoublyLinkedList(Generic[T]):
             
         Raises:
             IndexOutOfBoundsError: If the index is out of bounds
-            
+
         Time Complexity:
-            O(n) where n is the number of elements
+            O(min(index, n - index))
         """
         if not 0 <= index <= self._size:
             raise IndexOutOfBoundsError(f"Index {index} out of bounds [0, {self._size}]")
-        
+
         if index == 0:
             self.prepend(value)
             return
-        
+
         if index == self._size:
             self.append(value)
             return
-        
-        new_node = Node(value)
-        current = self.head
-        for _ in range(index):
-            current = current.next
-        
-        new_node.prev = current.prev
-        new_node.next = current
-        current.prev.next = new_node
-        current.prev = new_node
+
+        new_node = self._new_node(value)
+        reverse = self._reversed
+        # Both ends are reachable, so walk in from whichever is nearer;
+        # the worst case drops from n steps to n/2.
+        if index <= self._size // 2:
+            current = self.head
+            for _ in range(index):
+                current = current.prev if reverse else current.next
+        else:
+            current = self.tail
+            for _ in range(self._size - 1 - index):
+                current = current.next if reverse else current.prev
+
+        if reverse:
+            before = current.next
+            new_node.next = before
+            new_node.prev = current
+            before.prev = new_node
+            current.next = new_node
+        else:
+            before = current.prev
+            new_node.prev = before
+            new_node.next = current
+            before.next = new_node
+            current.prev = new_node
         self._size += 1
+        self._count_value(value)
     
     def to_list_forward(self) -> List[T]:
         """Convert the list to a Python list in forward order.
@@ -253,11 +413,16 @@ class MyDoublyLinkedList(Generic[T]):
         Time Complexity:
             O(n) where n is the number of elements
         """
+        # The size is known, so fill a preallocated list by index instead
+        # of growing one append at a time.
+        reverse = self._reversed
+        result: List[T] = [None] * self._size
         current = self.head
-        result = []
-        while current:
-            result.append(current.value)
-            current = current.next
+        i = 0
+        while current is not None:
+            result[i] = current.value
+            current = current.prev if reverse else current.next
+            i += 1
         return result
     
     def to_list_backward(self) -> List[T]:
@@ -269,11 +434,14 @@ class MyDoublyLinkedList(Generic[T]):
         Time Complexity:
             O(n) where n is the number of elements
         """
+        reverse = self._reversed
+        result: List[T] = [None] * self._size
         current = self.tail
-        result = []
-        while current:
-            result.append(current.value)
-            current = current.prev
+        i = 0
+        while current is not None:
+            result[i] = current.value
+            current = current.next if reverse else current.prev
+            i += 1
         return result
     
     def __iter__(self) -> Iterator[T]:
@@ -282,10 +450,11 @@ class MyDoublyLinkedList(Generic[T]):
         Returns:
             An iterator yielding each element in the list
         """
+        reverse = self._reversed
         current = self.head
-        while current:
+        while current is not None:
             yield current.value
-            current = current.next
+            current = current.prev if reverse else current.next
     
     def __str__(self) -> str:
         """Return a string representation of the list.
@@ -293,9 +462,19 @@ class MyDoublyLinkedList(Generic[T]):
         Returns:
             A string showing the list's contents
         """
-        if not self.head:
+        if self.head is None:
             return "Empty List"
-        return " <-> ".join(str(v) for v in self.to_list_forward()) + " <-> None"
+        # One pass that stringifies as it walks, instead of materializing
+        # the values first and converting them in a second pass.
+        reverse = self._reversed
+        parts: List[str] = [None] * self._size
+        current = self.head
+        i = 0
+        while current is not None:
+            parts[i] = str(current.value)
+            current = current.prev if reverse else current.next
+            i += 1
+        return " <-> ".join(parts) + " <-> None"
 
 
 if __name__ == "__main__":
@@ -23,11 +23,14 @@ Example:
 
 from typing import TypeVar, Generic, Iterator, Optional, Any
 from dataclasses import dataclass
-from DataStructures.my_array import MyArray
 
 K = TypeVar('K')
 V = TypeVar('V')
 
+# Sentinel marking an empty slot in the keys array. A private object is
+# used instead of None so None itself can be stored as a key.
+_EMPTY = object()
+
 @dataclass
 class HashTableError(Exception):
     """Base exception class for hash table operations."""
@@ -39,7 +42,11 @@ class KeyNotFoundError(HashTableError):
 
 class HashTableEntry(Generic[K, V]):
     """A single entry in the hash table.
-    
+
+    Retained for backward compatibility only: the table itself now keeps
+    keys and values in two parallel lists, so probes scan a dense keys
+    array instead of dereferencing per-entry objects.
+
     Attributes:
         key: The key of the entry
         value: The value associated with the key
@@ -64,7 +71,6 @@ class HashTable(Generic[K, V]):
     Attributes:
         capacity: The current capacity of the hash table
         size: The number of key-value pairs in the table
-        table: The underlying array storing the entries
         load_factor: The maximum load factor before resizing (default: 0.7)
     
     Type Parameters:
@@ -72,135 +78,270 @@ class HashTable(Generic[K, V]):
         V: The type of values stored in the table
     """
     
+    # Golden-ratio multiplier: spreads the low bits of hash() across the
+    # table so the power-of-two mask does not just read the raw low bits.
+    _MIX = 0x9E3779B97F4A7C15
+    # Mixed hashes are truncated to 64 bits before being cached, keeping
+    # them machine-word ints instead of arbitrarily long products.
+    _HASH_MASK = (1 << 64) - 1
+
     def __init__(self, capacity: int = 8, load_factor: float = 0.7) -> None:
         """Initialize an empty hash table.
-        
+
         Args:
-            capacity: Initial capacity of the hash table (default: 8)
+            capacity: Initial capacity of the hash table; rounded up to a
+                power of two so slots can be selected with a bitmask
+                (default: 8)
             load_factor: Maximum load factor before resizing (default: 0.7)
         """
+        capacity = 1 << max(3, (capacity - 1).bit_length())
         self.capacity = capacity
+        self._mask = capacity - 1
         self.size = 0
         self.load_factor = load_factor
-        self.table = MyArray[Optional[HashTableEntry[K, V]]](capacity)
-        for _ in range(capacity):
-            self.table.append(None)
-    
+        # Keys and values live in parallel lists: the probe loop only
+        # compares keys, so it streams a denser array and touches half
+        # the memory a combined entry list would. Each key's mixed hash
+        # is cached alongside it so probes can reject mismatches with an
+        # int comparison before falling back to full key equality.
+        self._keys: list = [_EMPTY] * capacity
+        self._vals: list = [None] * capacity
+        self._hashes: list = [0] * capacity
+
     def _hash(self, key: K) -> int:
-        """Compute the hash value for a key.
-        
+        """Compute the mixed 64-bit hash for a key.
+
+        Delegates to the built-in hash(), which runs in C (SipHash for
+        strings), then mixes instead of looping over the key's characters
+        in Python. Masking with the table mask turns the result into a
+        slot index; the full value is what gets cached per entry.
+
         Args:
             key: The key to hash
-            
+
         Returns:
-            The hash value for the key
-            
+            The mixed hash of the key
+
         Time Complexity:
-            O(k) where k is the length of the key's string representation
+            O(1) beyond the built-in hash of the key
         """
-        hash_value = 0
-        p = 31
-        m = self.capacity
-        for i, char in enumerate(str(key)):
-            hash_value += (ord(char) * (p ** i)) % m
-        return hash_value % m
-    
-    def _probe(self, index: int) -> Iterator[int]:
-        """Generate indices for linear probing.
-        
-        Args:
-            index: The initial index to start probing from
-            
-        Yields:
-            The next index to probe
-            
-        Time Complexity:
-            O(1) per iteration
-        """
-        while True:
-            yield index
-            index = (index + 1) % self.capacity
+        return (hash(key) * self._MIX) & self._HASH_MASK
     
     def put(self, key: K, value: V) -> None:
         """Insert a key-value pair into the hash table.
-        
+
+        The probe sequence is inlined as a while loop over locals rather
+        than driven by a generator, so each step is one index test and
+        one masked increment. Cached hashes are compared before keys, so
+        most collisions are rejected without an equality call.
+
         Args:
             key: The key to insert
             value: The value to associate with the key
-            
+
         Time Complexity:
             O(1) average case, O(n) worst case
         """
         if self.size >= self.capacity * self.load_factor:
             self._resize()
-        
-        index = self._hash(key)
-        for i in self._probe(index):
-            if self.table[i] is None or self.table[i].key == key:
-                if self.table[i] is None:
-                    self.size += 1
-                self.table[i] = HashTableEntry(key, value)
+
+        keys = self._keys
+        hashes = self._hashes
+        mask = self._mask
+        h = self._hash(key)
+        i = h & mask
+        while True:
+            slot = keys[i]
+            if slot is _EMPTY:
+                keys[i] = key
+                self._vals[i] = value
+                hashes[i] = h
+                self.size += 1
                 return
-    
+            if hashes[i] == h and slot == key:
+                self._vals[i] = value
+                return
+            i = (i + 1) & mask
+
+    def _put_inline(self, key: K, value: V) -> None:
+        """Insert a key-value pair without the load-factor check.
+
+        Used by put_many after the table has been pre-sized for the whole
+        batch, so the per-item resize branch in put would be dead weight.
+
+        Args:
+            key: The key to insert
+            value: The value to associate with the key
+        """
+        keys = self._keys
+        hashes = self._hashes
+        mask = self._mask
+        h = self._hash(key)
+        i = h & mask
+        while True:
+            slot = keys[i]
+            if slot is _EMPTY:
+                keys[i] = key
+                self._vals[i] = value
+                hashes[i] = h
+                self.size += 1
+                return
+            if hashes[i] == h and slot == key:
+                self._vals[i] = value
+                return
+            i = (i + 1) & mask
+
+    def put_many(self, items) -> None:
+        """Insert many key-value pairs with at most one resize.
+
+        The table is grown once up front to hold the whole batch under
+        the load factor, so the per-call load-factor branch and the
+        log-many intermediate doublings of looped put are skipped.
+
+        Args:
+            items: An iterable of (key, value) pairs
+
+        Time Complexity:
+            O(k) average case, where k is the number of pairs
+        """
+        items = list(items) if not isinstance(items, (list, tuple)) else items
+        needed = self.size + len(items)
+        target = self.capacity
+        while target * self.load_factor < needed:
+            target <<= 1
+        if target > self.capacity:
+            self._resize_to(target)
+        put_inline = self._put_inline
+        for key, value in items:
+            put_inline(key, value)
+
     def get(self, key: K) -> V:
         """Retrieve a value by its key.
-        
+
         Args:
             key: The key to look up
-            
+
         Returns:
             The value associated with the key
-            
+
         Raises:
             KeyNotFoundError: If the key is not found
-            
+
         Time Complexity:
             O(1) average case, O(n) worst case
         """
-        index = self._hash(key)
-        for i in self._probe(index):
-            if self.table[i] is None:
+        keys = self._keys
+        hashes = self._hashes
+        mask = self._mask
+        h = self._hash(key)
+        i = h & mask
+        while True:
+            slot = keys[i]
+            if slot is _EMPTY:
                 raise KeyNotFoundError(f"Key '{key}' not found")
-            if self.table[i].key == key:
-                return self.table[i].value
-    
+            if hashes[i] == h and slot == key:
+                return self._vals[i]
+            i = (i + 1) & mask
+
     def remove(self, key: K) -> None:
         """Remove a key-value pair from the hash table.
-        
+
+        Simply writing None into the slot would cut the probe chain of
+        every key that was inserted past it, making those keys silently
+        unfindable. Instead, entries after the hole are shifted back into
+        it when their ideal slot lies at or before the hole, so chains
+        stay intact and short.
+
         Args:
             key: The key to remove
-            
+
         Raises:
             KeyNotFoundError: If the key is not found
-            
+
         Time Complexity:
             O(1) average case, O(n) worst case
         """
-        index = self._hash(key)
-        for i in self._probe(index):
-            if self.table[i] is None:
+        keys = self._keys
+        vals = self._vals
+        hashes = self._hashes
+        mask = self._mask
+        h = self._hash(key)
+        i = h & mask
+        while True:
+            slot = keys[i]
+            if slot is _EMPTY:
                 raise KeyNotFoundError(f"Key '{key}' not found")
-            if self.table[i].key == key:
-                self.table[i] = None
-                self.size -= 1
-                return
+            if hashes[i] == h and slot == key:
+                break
+            i = (i + 1) & mask
+
+        self.size -= 1
+
+        # Backshift deletion: pull displaced entries into the hole,
+        # moving keys, values and cached hashes in lockstep. The ideal
+        # slot comes straight from the cached hash, so no key is rehashed.
+        j = (i + 1) & mask
+        while True:
+            shifted = keys[j]
+            if shifted is _EMPTY:
+                break
+            if ((j - (hashes[j] & mask)) & mask) >= ((j - i) & mask):
+                keys[i] = shifted
+                vals[i] = vals[j]
+                hashes[i] = hashes[j]
+                i = j
+            j = (j + 1) & mask
+        keys[i] = _EMPTY
+        vals[i] = None
     
     def _resize(self) -> None:
         """Resize the hash table to double its capacity.
-        
+
         Time Complexity:
             O(n) where n is the number of elements
         """
-        old_table = self.table
-        self.capacity *= 2
-        self.size = 0
-        self.table = MyArray[Optional[HashTableEntry[K, V]]](self.capacity)
-        for _ in range(self.capacity):
-            self.table.append(None)
-        
-        for item in old_table:
-            if item is not None:
-                self.put(item.key, item.value)
+        self._resize_to(self.capacity * 2)
+
+    def _resize_to(self, capacity: int) -> None:
+        """Grow the table to an exact power-of-two capacity.
+
+        The cached hashes make this a pure reshuffle: no key is hashed
+        again, each entry's new slot is its stored hash under the wider
+        mask.
+
+        Args:
+            capacity: The new capacity; must be a power of two larger
+                than the current capacity
+
+        Time Complexity:
+            O(n) where n is the number of elements
+        """
+        old_keys = self._keys
+        old_vals = self._vals
+        old_hashes = self._hashes
+        mask = capacity - 1
+        new_keys: list = [_EMPTY] * capacity
+        new_vals: list = [None] * capacity
+        new_hashes: list = [0] * capacity
+
+        # Place entries directly: every key is known to be unique and the
+        # new table cannot need another resize, so going through put would
+        # only repeat its load-factor and equality checks per entry.
+        for j, key in enumerate(old_keys):
+            if key is not _EMPTY:
+                h = old_hashes[j]
+                i = h & mask
+                while new_keys[i] is not _EMPTY:
+                    i = (i + 1) & mask
+                new_keys[i] = key
+                new_vals[i] = old_vals[j]
+                new_hashes[i] = h
+
+        self._keys = new_keys
+        self._vals = new_vals
+        self._hashes = new_hashes
+        self.capacity = capacity
+        self._mask = mask
     
     def is_empty(self) -> bool:
         """Check if the hash table is empty.
@@ -220,8 +361,10 @@ class HashTable(Generic[K, V]):
             O(n) where n is the capacity
         """
         self.size = 0
-        for i in range(self.capacity):
-            self.table[i] = None
+        capacity = self.capacity
+        self._keys = [_EMPTY] * capacity
+        self._vals = [None] * capacity
+        self._hashes = [0] * capacity
     
     def __iter__(self) -> Iterator[tuple[K, V]]:
         """Return an iterator over the key-value pairs in the hash table.
@@ -232,9 +375,10 @@ class HashTable(Generic[K, V]):
         Time Complexity:
             O(n) where n is the capacity
         """
-        for item in self.table:
-            if item is not None:
-                yield (item.key, item.value)
+        vals = self._vals
+        for i, key in enumerate(self._keys):
+            if key is not _EMPTY:
+                yield (key, vals[i])
     
     def __str__(self) -> str:
         """Return a string representation of the hash table.
@@ -244,10 +388,137 @@ class HashTable(Generic[K, V]):
         """
         if self.is_empty():
             return "{}"
-        items = [f"{entry.key}: {entry.value}" for entry in self.table if entry is not None]
+        items = [f"{key}: {value}" for key, value in self]
         return "{" + ", ".join(items) + "}"
 
 
+class FastHashTable(HashTable[K, V]):
+    """A hash table that delegates storage to a built-in dict.
+
+    HashTable implements open addressing in Python to show how a hash
+    table works; CPython's dict does the same job in tuned C and is an
+    order of magnitude faster. This subclass keeps the HashTable API but
+    routes every operation through an internal dict, so callers who need
+    throughput rather than the teaching internals can switch classes
+    without touching their code.
+
+    Type Parameters:
+        K: The type of keys stored in the table
+        V: The type of values stored in the table
+    """
+
+    def __init__(self, capacity: int = 8, load_factor: float = 0.7) -> None:
+        """Initialize an empty table.
+
+        Args:
+            capacity: Accepted for API compatibility; the dict manages
+                its own sizing (default: 8)
+            load_factor: Accepted for API compatibility (default: 0.7)
+        """
+        self.load_factor = load_factor
+        self._d: dict = {}
+
+    @property
+    def size(self) -> int:
+        """The number of key-value pairs in the table."""
+        return len(self._d)
+
+    @property
+    def capacity(self) -> int:
+        """Reported as the current size; the dict hides its real capacity."""
+        return len(self._d)
+
+    def put(self, key: K, value: V) -> None:
+        """Insert a key-value pair into the table.
+
+        Args:
+            key: The key to insert
+            value: The value to associate with the key
+
+        Time Complexity:
+            O(1) average case
+        """
+        self._d[key] = value
+
+    def put_many(self, items) -> None:
+        """Insert many key-value pairs at once.
+
+        Args:
+            items: An iterable of (key, value) pairs
+
+        Time Complexity:
+            O(k) average case, where k is the number of pairs
+        """
+        self._d.update(items)
+
+    def get(self, key: K) -> V:
+        """Retrieve a value by its key.
+
+        Args:
+            key: The key to look up
+
+        Returns:
+            The value associated with the key
+
+        Raises:
+            KeyNotFoundError: If the key is not found
+
+        Time Complexity:
+            O(1) average case
+        """
+        try:
+            return self._d[key]
+        except KeyError:
+            raise KeyNotFoundError(f"Key '{key}' not found") from None
+
+    def remove(self, key: K) -> None:
+        """Remove a key-value pair from the table.
+
+        Args:
+            key: The key to remove
+
+        Raises:
+            KeyNotFoundError: If the key is not found
+
+        Time Complexity:
+            O(1) average case
+        """
+        try:
+            del self._d[key]
+        except KeyError:
+            raise KeyNotFoundError(f"Key '{key}' not found") from None
+
+    def is_empty(self) -> bool:
+        """Check if the table is empty.
+
+        Returns:
+            True if the table is empty, False otherwise
+
+        Time Complexity:
+            O(1)
+        """
+        return not self._d
+
+    def clear(self) -> None:
+        """Remove all key-value pairs from the table.
+
+        Time Complexity:
+            O(n) where n is the number of elements
+        """
+        self._d.clear()
+
+    def __iter__(self) -> Iterator[tuple[K, V]]:
+        """Return an iterator over the key-value pairs in the table.
+
+        Returns:
+            An iterator yielding (key, value) pairs
+
+        Time Complexity:
+            O(n) where n is the number of elements
+        """
+        return iter(self._d.items())
+
+
 if __name__ == "__main__":
     def test_hash_table():
         """Test the hash table implementation with various operations."""
@@ -306,5 +577,18 @@ if __name__ == "__main__":
             table.put(123, "string")  # Type error
         except TypeError as e:
             print(f"Expected error: {e}")
-    
+
+        # Test the dict-backed fast variant through the same API
+        print("\nTesting FastHashTable:")
+        fast = FastHashTable[str, int]()
+        for key, value in test_data:
+            fast.put(key, value)
+        print(f"Populated: {fast}")
+        fast.remove("two")
+        print(f"After removing 'two': {fast} (size {fast.size})")
+        try:
+            fast.get("nonexistent")
+        except KeyNotFoundError as e:
+            print(f"Expected error: {e}")
+
     test_hash_table()
@@ -22,21 +22,19 @@ Example:
     >>> print(min_heap.extract_min())  # Output: 1
 """
 
-from typing import TypeVar, Generic, Iterator
-from dataclasses import dataclass
-from DataStructures.my_array import MyArray
+from __future__ import annotations
 
-T = TypeVar('T', bound='Comparable')
+import heapq
+import operator
 
-class Comparable:
-    """Protocol for comparable types."""
-    def __lt__(self, other: 'Comparable') -> bool: ...
-    def __gt__(self, other: 'Comparable') -> bool: ...
+from array import array
+from typing import TypeVar, Generic, Iterator, List
+
+T = TypeVar('T')
 
-@dataclass
 class HeapError(Exception):
     """Base exception class for heap operations."""
-    message: str
+    pass
 
 class EmptyHeapError(HeapError):
     """Raised when trying to perform operations on an empty heap."""
@@ -48,16 +46,39 @@ class MyHeap(Generic[T]):
     This class provides the base implementation for both min and max heaps.
     It uses a dynamic array for efficient operations.
     
+    The min and max variants differ only in the direction of one
+    comparison, so the sift kernels live here once, parametrized by a
+    comparator bound at construction (operator.lt for min, operator.gt
+    for max). The comparator is rebound to a local before each sift
+    loop, making it a plain C-level call per comparison.
+
     Attributes:
-        data: The underlying dynamic array storing heap elements
+        data: The underlying list storing heap elements
+        D: The arity of the heap (class attribute). A 4-ary heap is the
+            default: the tree is half as deep as a binary one, so sifts
+            make fewer Python-level hops, and the extra comparisons per
+            level are cheap sequential reads of adjacent slots. Subclass
+            with D = 2 (or 8) to change the trade-off.
     
     Type Parameters:
         T: The type of elements stored in the heap (must be comparable)
     """
-    
-    def __init__(self) -> None:
-        """Initialize an empty heap."""
-        self.data = MyArray[T]()
+
+    D = 4
+
+    def __init__(self, reverse: bool = False) -> None:
+        """Initialize an empty heap.
+
+        A plain list backs the heap: it already gives O(1) indexed
+        access, append and pop, and indexing it is a C-level operation
+        instead of a Python-level MyArray method call on every
+        comparison and swap in the sift loops.
+
+        Args:
+            reverse: False for a min heap, True for a max heap
+        """
+        self._cmp = operator.gt if reverse else operator.lt
+        self.data: List[T] = []
     
     def _parent(self, index: int) -> int:
         """Get the parent index of a given index.
@@ -68,29 +89,21 @@ class MyHeap(Generic[T]):
         Returns:
             The parent index
         """
-        return (index - 1) // 2
-    
-    def _left(self, index: int) -> int:
-        """Get the left child index of a given index.
-        
-        Args:
-            index: The index to find the left child of
-            
-        Returns:
-            The left child index
-        """
-        return 2 * index + 1
+        return (index - 1) // self.D
     
-    def _right(self, index: int) -> int:
-        """Get the right child index of a given index.
-        
+    def _first_child(self, index: int) -> int:
+        """Get the index of the first child of a given index.
+
+        The children of index i occupy the D consecutive slots starting
+        here.
+
         Args:
-            index: The index to find the right child of
+            index: The index to find the first child of
             
         Returns:
-            The right child index
+            The first child index
         """
-        return 2 * index + 2
+        return self.D * index + 1
     
     def insert(self, value: T) -> None:
         """Insert a new value into the heap.
@@ -102,29 +115,211 @@ class MyHeap(Generic[T]):
             O(log n) where n is the number of elements
         """
         self.data.append(value)
-        self._heapify_up(self.data.length - 1)
-    
+        self._heapify_up(len(self.data) - 1)
+
+    @classmethod
+    def heapify(cls, iterable) -> 'MyHeap[T]':
+        """Build a heap from an iterable in O(n).
+
+        Copies the values in one bulk list() call, then runs Floyd's
+        bottom-up build: sift down every internal node from the last one
+        back to the root. Most nodes sit near the leaves and sink only a
+        level or two, which is why the total is O(n) rather than the
+        O(n log n) of n repeated inserts.
+
+        Args:
+            iterable: The values to build the heap from
+
+        Returns:
+            A new heap containing all the values
+
+        Time Complexity:
+            O(n) where n is the number of values
+        """
+        heap = cls()
+        heap.data = list(iterable)
+        # (n - 2) // D is the parent of the last element, i.e. the last
+        # internal node; for n < 2 the range is empty.
+        for i in range((len(heap.data) - 2) // cls.D, -1, -1):
+            heap._heapify_down(i)
+        return heap
+
+    def insert_many(self, iterable) -> None:
+        """Insert many values with one bulk append.
+
+        The values land in the backing list via a single C-level
+        extend, then the cheaper of two repair strategies runs: when the
+        batch rivals the existing heap in size, a full Floyd rebuild is
+        O(n + k); when the batch is small, sifting just the new items up
+        is O(k log n) and leaves the settled part untouched.
+
+        Args:
+            iterable: The values to insert
+
+        Time Complexity:
+            O(min(n + k, k log n)) for k values into a heap of n
+        """
+        data = self.data
+        start = len(data)
+        data.extend(iterable)
+        n = len(data)
+        if n == start:
+            return
+        if n - start >= start:
+            for i in range((n - 2) // self.D, -1, -1):
+                self._heapify_down(i)
+        else:
+            for i in range(start, n):
+                self._heapify_up(i)
+
     def _heapify_up(self, index: int) -> None:
-        """Maintain heap property by bubbling up an element.
-        
+        """Maintain the heap property by bubbling up an element.
+
+        Uses the hole technique from CPython's heapq: the element is held
+        in a local while parents shift down into the hole, and is written
+        back once at its final position. That halves the list stores of a
+        swap per level and reads each parent only once.
+
         Args:
             index: The index of the element to bubble up
-            
+
         Time Complexity:
             O(log n) where n is the number of elements
         """
-        pass  # To be implemented in subclasses
-    
+        data = self.data
+        d = self.D
+        cmp = self._cmp
+        item = data[index]
+        while index > 0:
+            parent = (index - 1) // d
+            p = data[parent]
+            if cmp(item, p):
+                data[index] = p
+                index = parent
+            else:
+                break
+        data[index] = item
+
     def _heapify_down(self, index: int) -> None:
-        """Maintain heap property by bubbling down an element.
-        
+        """Maintain the heap property by bubbling down an element.
+
+        Moves the hole all the way down to a leaf, choosing the winning
+        child at each level without comparing against the displaced
+        element, then sifts the element up from that leaf. Since the
+        displaced element came from the bottom, its final spot is almost
+        always near a leaf, so this cuts average comparisons roughly in
+        half versus testing it at every level on the way down.
+
         Args:
             index: The index of the element to bubble down
-            
+
         Time Complexity:
             O(log n) where n is the number of elements
         """
-        pass  # To be implemented in subclasses
+        data = self.data
+        n = len(data)
+        d = self.D
+        cmp = self._cmp
+        item = data[index]
+        start = index
+        first = d * index + 1
+        while first < n:
+            # Scan the up-to-D children (adjacent slots) for the winner.
+            best = first
+            v = data[best]
+            end = first + d
+            if end > n:
+                end = n
+            for c in range(first + 1, end):
+                cv = data[c]
+                if cmp(cv, v):
+                    best = c
+                    v = cv
+            data[index] = v
+            index = best
+            first = d * index + 1
+        while index > start:
+            parent = (index - 1) // d
+            p = data[parent]
+            if not cmp(item, p):
+                break
+            data[index] = p
+            index = parent
+        data[index] = item
+
+    def extract(self) -> T:
+        """Remove and return the root element of the heap.
+
+        Returns:
+            The smallest (min heap) or largest (max heap) element
+
+        Raises:
+            EmptyHeapError: If the heap is empty
+
+        Time Complexity:
+            O(log n) where n is the number of elements
+        """
+        data = self.data
+        if not data:
+            raise EmptyHeapError("Cannot extract from empty heap")
+        # A single element needs no re-sift and no root rewrite.
+        if len(data) == 1:
+            return data.pop()
+        root = data[0]
+        data[0] = data.pop()
+        self._heapify_down(0)
+        return root
+
+    def pushpop(self, value: T) -> T:
+        """Insert a value, then extract the root, in one sift.
+
+        Equivalent to insert() followed by extract() but with a single
+        downward sift instead of one up and one down — and no sift at
+        all when the new value already wins against the root. This is
+        the workhorse of the top-k idiom, same as heapq.heappushpop.
+
+        Args:
+            value: The value to insert
+
+        Returns:
+            The winner among the heap's elements and the new value
+
+        Time Complexity:
+            O(log n) where n is the number of elements
+        """
+        data = self.data
+        if not data or not self._cmp(data[0], value):
+            return value
+        result = data[0]
+        data[0] = value
+        self._heapify_down(0)
+        return result
+
+    def replace(self, value: T) -> T:
+        """Extract the root, then insert a value, in one sift.
+
+        Unlike pushpop, the returned element may lose to the new value;
+        the heap's size never changes.
+
+        Args:
+            value: The value to insert
+
+        Returns:
+            The previous root
+
+        Raises:
+            EmptyHeapError: If the heap is empty
+
+        Time Complexity:
+            O(log n) where n is the number of elements
+        """
+        data = self.data
+        if not data:
+            raise EmptyHeapError("Cannot replace in empty heap")
+        result = data[0]
+        data[0] = value
+        self._heapify_down(0)
+        return result
     
     def peek(self) -> T:
         """Get the root element without removing it.
@@ -138,7 +333,7 @@ class MyHeap(Generic[T]):
         Time Complexity:
             O(1)
         """
-        if self.data.length == 0:
+        if len(self.data) == 0:
             raise EmptyHeapError("Cannot peek from empty heap")
         return self.data[0]
     
@@ -151,7 +346,7 @@ class MyHeap(Generic[T]):
         Time Complexity:
             O(1)
         """
-        return self.data.length == 0
+        return len(self.data) == 0
     
     def size(self) -> int:
         """Get the number of elements in the heap.
@@ -162,7 +357,7 @@ class MyHeap(Generic[T]):
         Time Complexity:
             O(1)
         """
-        return self.data.length
+        return len(self.data)
     
     def __iter__(self) -> Iterator[T]:
         """Return an iterator over the elements of the heap.
@@ -170,8 +365,7 @@ class MyHeap(Generic[T]):
         Returns:
             An iterator yielding each element in the heap
         """
-        for i in range(self.data.length):
-            yield self.data[i]
+        return iter(self.data)
     
     def __str__(self) -> str:
         """Return a string representation of the heap.
@@ -181,135 +375,201 @@ class MyHeap(Generic[T]):
         """
         if self.is_empty():
             return "Empty Heap"
-        return "Heap: [" + ", ".join(str(self.data[i]) for i in range(self.data.length)) + "]"
+        # map(str, ...) iterates the backing store directly in C instead
+        # of one indexed load per element.
+        return "Heap: [" + ", ".join(map(str, self.data)) + "]"
 
 
 class MyMinHeap(MyHeap[T]):
-    """A binary min heap implementation.
+    """A d-ary min heap implementation.
     
     This class implements a min heap where the smallest element is always at the root.
     All elements must be comparable.
     """
-    
-    def _heapify_up(self, index: int) -> None:
-        """Maintain min heap property by bubbling up an element.
-        
-        Args:
-            index: The index of the element to bubble up
-        """
-        while index > 0 and self.data[index] < self.data[self._parent(index)]:
-            self.data[index], self.data[self._parent(index)] = (
-                self.data[self._parent(index)],
-                self.data[index]
-            )
-            index = self._parent(index)
-    
+
+    def __init__(self) -> None:
+        """Initialize an empty min heap."""
+        super().__init__(reverse=False)
+
     def extract_min(self) -> T:
         """Remove and return the smallest element in the heap.
-        
+
         Returns:
             The smallest element
-            
+
         Raises:
             EmptyHeapError: If the heap is empty
-            
+
         Time Complexity:
             O(log n) where n is the number of elements
         """
-        if self.data.length == 0:
-            raise EmptyHeapError("Cannot extract from empty heap")
-        
-        root = self.data[0]
-        last = self.data.pop()
-        
-        if self.data.length > 0:
-            self.data[0] = last
-            self._heapify_down(0)
-        
-        return root
-    
-    def _heapify_down(self, index: int) -> None:
-        """Maintain min heap property by bubbling down an element.
-        
-        Args:
-            index: The index of the element to bubble down
-        """
-        smallest = index
-        left = self._left(index)
-        right = self._right(index)
-        
-        if left < self.data.length and self.data[left] < self.data[smallest]:
-            smallest = left
-        if right < self.data.length and self.data[right] < self.data[smallest]:
-            smallest = right
-        
-        if smallest != index:
-            self.data[smallest], self.data[index] = self.data[index], self.data[smallest]
-            self._heapify_down(smallest)
+        return self.extract()
 
 
 class MyMaxHeap(MyHeap[T]):
-    """A binary max heap implementation.
+    """A d-ary max heap implementation.
     
     This class implements a max heap where the largest element is always at the root.
     All elements must be comparable.
     """
-    
-    def _heapify_up(self, index: int) -> None:
-        """Maintain max heap property by bubbling up an element.
-        
-        Args:
-            index: The index of the element to bubble up
-        """
-        while index > 0 and self.data[index] > self.data[self._parent(index)]:
-            self.data[index], self.data[self._parent(index)] = (
-                self.data[self._parent(index)],
-                self.data[index]
-            )
-            index = self._parent(index)
-    
+
+    def __init__(self) -> None:
+        """Initialize an empty max heap."""
+        super().__init__(reverse=True)
+
     def extract_max(self) -> T:
         """Remove and return the largest element in the heap.
-        
+
         Returns:
             The largest element
-            
+
         Raises:
             EmptyHeapError: If the heap is empty
-            
+
         Time Complexity:
             O(log n) where n is the number of elements
         """
-        if self.data.length == 0:
+        return self.extract()
+
+
+class FastMinHeap(MyMinHeap[T]):
+    """A min heap whose sift kernels run in C via the stdlib heapq.
+
+    The sift loops above are the entire cost of insert and extract, and
+    CPython ships exactly those loops as a C extension (_heapq). This
+    subclass keeps the MyMinHeap API but delegates the sifts to
+    heapq.heappush/heappop, the same escape hatch FastHashTable provides
+    over HashTable. The arity is pinned to 2 because heapq maintains a
+    binary heap; the inherited methods stay correct under that layout.
+    """
+
+    D = 2
+
+    def insert(self, value: T) -> None:
+        """Insert a new value into the heap.
+
+        Args:
+            value: The value to insert
+
+        Time Complexity:
+            O(log n) where n is the number of elements
+        """
+        heapq.heappush(self.data, value)
+
+    @classmethod
+    def heapify(cls, iterable) -> 'FastMinHeap[T]':
+        """Build a heap from an iterable in O(n).
+
+        Args:
+            iterable: The values to build the heap from
+
+        Returns:
+            A new heap containing all the values
+
+        Time Complexity:
+            O(n) where n is the number of values
+        """
+        heap = cls()
+        heap.data = list(iterable)
+        heapq.heapify(heap.data)
+        return heap
+
+    def extract_min(self) -> T:
+        """Remove and return the smallest element in the heap.
+
+        Returns:
+            The smallest element
+
+        Raises:
+            EmptyHeapError: If the heap is empty
+
+        Time Complexity:
+            O(log n) where n is the number of elements
+        """
+        if len(self.data) == 0:
             raise EmptyHeapError("Cannot extract from empty heap")
-        
-        root = self.data[0]
-        last = self.data.pop()
-        
-        if self.data.length > 0:
-            self.data[0] = last
-            self._heapify_down(0)
-        
-        return root
-    
-    def _heapify_down(self, index: int) -> None:
-        """Maintain max heap property by bubbling down an element.
-        
+        return heapq.heappop(self.data)
+
+    def pushpop(self, value: T) -> T:
+        """Insert a value, then extract the minimum, in one C-level sift.
+
         Args:
-            index: The index of the element to bubble down
+            value: The value to insert
+
+        Returns:
+            The smallest of the heap's elements and the new value
+
+        Time Complexity:
+            O(log n) where n is the number of elements
         """
-        largest = index
-        left = self._left(index)
-        right = self._right(index)
-        
-        if left < self.data.length and self.data[left] > self.data[largest]:
-            largest = left
-        if right < self.data.length and self.data[right] > self.data[largest]:
-            largest = right
-        
-        if largest != index:
-            self.data[largest], self.data[index] = self.data[index], self.data[largest]
-            self._heapify_down(largest)
+        return heapq.heappushpop(self.data, value)
+
+    def replace(self, value: T) -> T:
+        """Extract the minimum, then insert a value, in one C-level sift.
+
+        Args:
+            value: The value to insert
+
+        Returns:
+            The previous minimum
+
+        Raises:
+            EmptyHeapError: If the heap is empty
+
+        Time Complexity:
+            O(log n) where n is the number of elements
+        """
+        if len(self.data) == 0:
+            raise EmptyHeapError("Cannot replace in empty heap")
+        return heapq.heapreplace(self.data, value)
+
+
+class MyNumericMinHeap(MyMinHeap[T]):
+    """A min heap for numeric payloads stored unboxed in an array.array.
+
+    A list of Python ints costs ~28 bytes of PyLong box plus an 8-byte
+    pointer per element; a typed buffer packs each value into 8 bytes of
+    contiguous memory, the same layout a NumPy-backed heap would use but
+    without adding a dependency. The inherited sift kernels work
+    unchanged because array.array supports the same indexing, append and
+    pop the list backing does (values are boxed transiently during
+    comparison, which is unavoidable in pure Python).
+
+    Attributes:
+        typecode: The array.array typecode of the backing buffer
+    """
+
+    def __init__(self, typecode: str = 'q') -> None:
+        """Initialize an empty numeric heap.
+
+        Args:
+            typecode: array.array typecode for the backing buffer, e.g.
+                'q' for int64 or 'd' for float64 (default: 'q')
+        """
+        super().__init__()
+        self.typecode = typecode
+        self.data = array(typecode)
+
+    @classmethod
+    def heapify(cls, iterable, typecode: str = 'q') -> 'MyNumericMinHeap[T]':
+        """Build a numeric heap from an iterable in O(n).
+
+        Args:
+            iterable: The values to build the heap from
+            typecode: array.array typecode for the backing buffer
+                (default: 'q')
+
+        Returns:
+            A new heap containing all the values
+
+        Time Complexity:
+            O(n) where n is the number of values
+        """
+        heap = cls(typecode)
+        heap.data = array(typecode, iterable)
+        for i in range((len(heap.data) - 2) // cls.D, -1, -1):
+            heap._heapify_down(i)
+        return heap
 
 
 if __name__ == "__main__":
@@ -326,6 +586,12 @@ if __name__ == "__main__":
             min_heap.insert(i)
             print(f"Inserted {i}: {min_heap}")
         
+        # Test heapify
+        print("\nTesting heapify:")
+        built = MyMinHeap.heapify([10, 4, 15, 2, 8])
+        print(f"Heapified [10, 4, 15, 2, 8]: {built}")
+        print(f"Min of heapified: {built.peek()}")
+
         # Test peek
         print("\nTesting peek:")
         print(f"Min element: {min_heap.peek()}")
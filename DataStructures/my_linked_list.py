@@ -12,6 +12,14 @@ Features:
 - Efficient memory usage
 - Iterator support
 
+The nodes are deliberately real linked objects rather than indices into
+parallel value/next arrays. A struct-of-arrays layout would shrink the
+footprint and make traversal prefetch-friendly, but it turns every
+structural operation into index bookkeeping and stops teaching the
+pointer manipulation this module exists to demonstrate. The slotted,
+pooled nodes used here recover most of the memory overhead instead, and
+MyArrayList below covers callers who want contiguous storage.
+
 Example:
     >>> lst = MyLinkedList[int]()
     >>> lst.append(1)
@@ -21,6 +29,7 @@ Example:
     >>> print(lst)  # Output: 1 -> 3 -> 2 -> None
 """
 
+from array import array
 from typing import TypeVar, Generic, Optional, Iterator
 from dataclasses import dataclass
 
@@ -46,6 +55,9 @@ class Node(Generic[T]):
         value: The value stored in the node
         next: Reference to the next node
     """
+
+    __slots__ = ('value', 'next')
+
     def __init__(self, value: T) -> None:
         """Initialize a new node.
         
@@ -70,12 +82,84 @@ class MyLinkedList(Generic[T]):
     Type Parameters:
         T: The type of elements stored in the list
     """
-    
+
+    # Retired nodes are kept for reuse up to this many, so add/remove
+    # heavy workloads stop hitting the allocator and GC entirely.
+    _POOL_LIMIT = 1024
+
     def __init__(self) -> None:
         """Initialize an empty linked list."""
-        self.head: Optional[Node[T]] = None
-        self.tail: Optional[Node[T]] = None
+        # A permanent sentinel sits in front of the first element, so
+        # every mutation has a real predecessor node to relink through
+        # and the head/empty special cases disappear from the hot paths.
+        self._sentinel: Node[T] = Node(None)
+        self.tail: Node[T] = self._sentinel
         self._size: int = 0
+        self._free: list = []
+        # Occurrence counter per value: contains() and the miss cases of
+        # find()/delete() answer from this dict in O(1) instead of
+        # walking the list. Set to None the first time an unhashable
+        # value is stored, which disables the fast path.
+        self._counts: Optional[dict] = {}
+
+    @property
+    def head(self) -> Optional[Node[T]]:
+        """The first node of the list, or None when the list is empty."""
+        return self._sentinel.next
+
+    def _count_value(self, value: T) -> None:
+        """Record one more occurrence of value in the counter.
+
+        Args:
+            value: The value being inserted
+        """
+        counts = self._counts
+        if counts is not None:
+            try:
+                counts[value] = counts.get(value, 0) + 1
+            except TypeError:
+                self._counts = None
+
+    def _uncount_value(self, value: T) -> None:
+        """Record one fewer occurrence of value in the counter.
+
+        Args:
+            value: The value being removed
+        """
+        counts = self._counts
+        if counts is not None:
+            remaining = counts.get(value, 0) - 1
+            if remaining > 0:
+                counts[value] = remaining
+            else:
+                counts.pop(value, None)
+
+    def _new_node(self, value: T) -> Node[T]:
+        """Return a node holding value, reusing a pooled node when possible.
+
+        Args:
+            value: The value to store in the node
+
+        Returns:
+            A fresh or recycled node with a cleared next link
+        """
+        free = self._free
+        if free:
+            node = free.pop()
+            node.value = value
+            return node
+        return Node(value)
+
+    def _recycle_node(self, node: Node[T]) -> None:
+        """Return a detached node to the pool for reuse.
+
+        Args:
+            node: The node to recycle; must already be unlinked
+        """
+        if len(self._free) < self._POOL_LIMIT:
+            node.value = None
+            node.next = None
+            self._free.append(node)
     
     def append(self, value: T) -> None:
         """Append an element to the end of the list.
@@ -86,14 +170,12 @@ class MyLinkedList(Generic[T]):
         Time Complexity:
             O(1)
         """
-        new_node = Node(value)
-        if not self.head:
-            self.head = self.tail = new_node
-        else:
-            self.tail.next = new_node
-            self.tail = new_node
+        new_node = self._new_node(value)
+        self.tail.next = new_node
+        self.tail = new_node
         self._size += 1
-    
+        self._count_value(value)
+
     def prepend(self, value: T) -> None:
         """Prepend an element to the start of the list.
         
@@ -103,45 +185,86 @@ class MyLinkedList(Generic[T]):
         Time Complexity:
             O(1)
         """
-        new_node = Node(value)
-        if not self.head:
-            self.head = self.tail = new_node
-        else:
-            new_node.next = self.head
-            self.head = new_node
+        sentinel = self._sentinel
+        new_node = self._new_node(value)
+        new_node.next = sentinel.next
+        sentinel.next = new_node
+        if self.tail is sentinel:
+            self.tail = new_node
         self._size += 1
+        self._count_value(value)
     
+    def extend(self, values) -> None:
+        """Append every element of an iterable to the end of the list.
+
+        The new nodes are chained up off to the side and spliced in with
+        a single tail link, so the list's head/tail bookkeeping runs once
+        per call instead of once per element.
+
+        Args:
+            values: An iterable of values to append
+
+        Time Complexity:
+            O(k) where k is the number of new elements
+        """
+        chain_head = chain_tail = None
+        count = 0
+        for value in values:
+            node = self._new_node(value)
+            if chain_head is None:
+                chain_head = chain_tail = node
+            else:
+                chain_tail.next = node
+                chain_tail = node
+            self._count_value(value)
+            count += 1
+        if chain_head is None:
+            return
+        self.tail.next = chain_head
+        self.tail = chain_tail
+        self._size += count
+
     def delete(self, value: T) -> bool:
         """Delete the first occurrence of a value from the list.
-        
+
         Args:
             value: The value to delete
-            
+
         Returns:
             True if the value was found and deleted, False otherwise
-            
+
         Time Complexity:
             O(n) where n is the number of elements
         """
-        if not self.head:
-            return False
-        
-        if self.head.value == value:
-            self.head = self.head.next
-            if not self.head:
-                self.tail = None
-            self._size -= 1
-            return True
-        
-        current = self.head
-        while current.next and current.next.value != value:
-            current = current.next
-        
-        if current.next:
-            if current.next == self.tail:
+        # The counter settles the miss case without touching a node; an
+        # unhashable value raises TypeError and falls through to the walk.
+        counts = self._counts
+        if counts is not None:
+            try:
+                if counts.get(value, 0) == 0:
+                    return False
+            except TypeError:
+                pass
+
+        # Starting from the sentinel gives the first element a real
+        # predecessor, so the head case needs no special handling. Hoist
+        # the next pointer so each iteration loads it once instead of
+        # three times.
+        current = self._sentinel
+        nxt = current.next
+        while nxt is not None and nxt.value != value:
+            current = nxt
+            nxt = nxt.next
+
+        if nxt is not None:
+            self._uncount_value(nxt.value)
+            # Identity check: tail is a node reference, and is avoids any
+            # chance of invoking a user-defined __eq__.
+            if nxt is self.tail:
                 self.tail = current
-            current.next = current.next.next
+            current.next = nxt.next
             self._size -= 1
+            self._recycle_node(nxt)
             return True
         
         return False
@@ -156,8 +279,16 @@ class MyLinkedList(Generic[T]):
             The index of the first occurrence, or -1 if not found
             
         Time Complexity:
-            O(n) where n is the number of elements
+            O(1) when the value is not present (and the counter is
+            active), O(n) otherwise
         """
+        counts = self._counts
+        if counts is not None:
+            try:
+                if counts.get(value, 0) == 0:
+                    return -1
+            except TypeError:
+                pass
         current = self.head
         index = 0
         while current:
@@ -166,6 +297,29 @@ class MyLinkedList(Generic[T]):
             current = current.next
             index += 1
         return -1
+
+    def contains(self, value: T) -> bool:
+        """Check if the list contains a value.
+
+        Duplicates are fine: the counter tracks occurrence counts, so
+        membership stays correct until the last copy is removed.
+
+        Args:
+            value: The value to check for
+
+        Returns:
+            True if the value is in the list, False otherwise
+
+        Time Complexity:
+            O(1) with the counter active, O(n) for unhashable values
+        """
+        counts = self._counts
+        if counts is not None:
+            try:
+                return counts.get(value, 0) > 0
+            except TypeError:
+                pass
+        return self.find(value) != -1
     
     def size(self) -> int:
         """Get the number of elements in the list.
@@ -195,15 +349,18 @@ class MyLinkedList(Generic[T]):
         Time Complexity:
             O(n) where n is the number of elements
         """
+        # Single attribute load up front; the loop then runs entirely on
+        # locals.
+        sentinel = self._sentinel
+        current = sentinel.next
+        self.tail = current if current is not None else sentinel
         prev = None
-        current = self.head
-        self.tail = self.head
         while current:
             next_node = current.next
             current.next = prev
             prev = current
             current = next_node
-        self.head = prev
+        sentinel.next = prev
     
     def insert_at(self, index: int, value: T) -> None:
         """Insert a value at the specified index.
@@ -229,13 +386,14 @@ class MyLinkedList(Generic[T]):
             self.append(value)
             return
         
-        new_node = Node(value)
-        current = self.head
+        new_node = self._new_node(value)
+        current = self._sentinel.next
         for _ in range(index - 1):
             current = current.next
         new_node.next = current.next
         current.next = new_node
         self._size += 1
+        self._count_value(value)
     
     def remove_at(self, index: int) -> None:
         """Remove the element at the specified index.
@@ -255,27 +413,60 @@ class MyLinkedList(Generic[T]):
         
         if not 0 <= index < self._size:
             raise IndexOutOfBoundsError(f"Index {index} out of bounds [0, {self._size})")
-        
-        if index == 0:
-            self.head = self.head.next
-            if not self.head:
-                self.tail = None
-            self._size -= 1
-            return
-        
-        current = self.head
-        for _ in range(index - 1):
+
+        # Walking from the sentinel makes index 0 the same shape as any
+        # other index: the predecessor always exists.
+        current = self._sentinel
+        for _ in range(index):
             current = current.next
-        
-        if current.next == self.tail:
+
+        victim = current.next
+        self._uncount_value(victim.value)
+        if victim is self.tail:
             self.tail = current
-        
-        current.next = current.next.next
+
+        current.next = victim.next
         self._size -= 1
+        self._recycle_node(victim)
     
+    def to_list(self) -> list:
+        """Convert the linked list to a Python list in one walk.
+
+        Returns:
+            A list of the list's elements, head to tail
+
+        Time Complexity:
+            O(n) where n is the number of elements
+        """
+        result: list = [None] * self._size
+        current = self._sentinel.next
+        i = 0
+        while current:
+            result[i] = current.value
+            current = current.next
+            i += 1
+        return result
+
+    @classmethod
+    def from_iterable(cls, values) -> 'MyLinkedList[T]':
+        """Build a linked list from an iterable in one pass.
+
+        Args:
+            values: An iterable of values to append, head first
+
+        Returns:
+            A new list containing the values in order
+
+        Time Complexity:
+            O(n) where n is the number of elements
+        """
+        lst = cls()
+        lst.extend(values)
+        return lst
+
     def __iter__(self) -> Iterator[T]:
         """Return an iterator over the elements of the list.
-        
+
         Returns:
             An iterator yielding each element in the list
         """
@@ -292,13 +483,513 @@ class MyLinkedList(Generic[T]):
         """
         if not self.head:
             return "Empty List"
-        
+        # The size is known, so fill a preallocated list in one pass that
+        # stringifies as it walks, instead of growing a list append by
+        # append and joining afterwards.
+        parts: list = [None] * self._size
         current = self.head
-        result = []
+        i = 0
         while current:
-            result.append(str(current.value))
+            parts[i] = str(current.value)
             current = current.next
-        return " -> ".join(result) + " -> None"
+            i += 1
+        return " -> ".join(parts) + " -> None"
+
+
+class MyArrayList(Generic[T]):
+    """A list-backed alternative to MyLinkedList with the same API.
+
+    Pointer chasing costs a Python-level attribute load (and usually a
+    cache miss) per hop; a contiguous list walks, searches and reverses
+    in single C loops. Unless head-insertions dominate the workload —
+    prepend here is O(n) where the linked list's is O(1) — this is the
+    performance-oriented choice. MyLinkedList stays as the structure the
+    module exists to teach.
+
+    Type Parameters:
+        T: The type of elements stored in the list
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty list."""
+        self._items: list = []
+
+    def append(self, value: T) -> None:
+        """Append an element to the end of the list.
+
+        Args:
+            value: The value to append
+
+        Time Complexity:
+            O(1) amortized
+        """
+        self._items.append(value)
+
+    def extend(self, values) -> None:
+        """Append every element of an iterable to the end of the list.
+
+        Args:
+            values: An iterable of values to append
+
+        Time Complexity:
+            O(k) where k is the number of new elements (C-level extend)
+        """
+        self._items.extend(values)
+
+    def prepend(self, value: T) -> None:
+        """Prepend an element to the start of the list.
+
+        Args:
+            value: The value to prepend
+
+        Time Complexity:
+            O(n) where n is the number of elements (elements shift right)
+        """
+        self._items.insert(0, value)
+
+    def delete(self, value: T) -> bool:
+        """Delete the first occurrence of a value from the list.
+
+        Args:
+            value: The value to delete
+
+        Returns:
+            True if the value was found and deleted, False otherwise
+
+        Time Complexity:
+            O(n) where n is the number of elements
+        """
+        try:
+            self._items.remove(value)
+            return True
+        except ValueError:
+            return False
+
+    def find(self, value: T) -> int:
+        """Find the index of the first occurrence of a value.
+
+        Args:
+            value: The value to find
+
+        Returns:
+            The index of the first occurrence, or -1 if not found
+
+        Time Complexity:
+            O(n) where n is the number of elements (C-level scan)
+        """
+        try:
+            return self._items.index(value)
+        except ValueError:
+            return -1
+
+    def contains(self, value: T) -> bool:
+        """Check if the list contains a value.
+
+        Args:
+            value: The value to check for
+
+        Returns:
+            True if the value is in the list, False otherwise
+
+        Time Complexity:
+            O(n) where n is the number of elements (C-level scan)
+        """
+        return value in self._items
+
+    def size(self) -> int:
+        """Get the number of elements in the list.
+
+        Returns:
+            The current size of the list
+
+        Time Complexity:
+            O(1)
+        """
+        return len(self._items)
+
+    def is_empty(self) -> bool:
+        """Check if the list is empty.
+
+        Returns:
+            True if the list is empty, False otherwise
+
+        Time Complexity:
+            O(1)
+        """
+        return not self._items
+
+    def reverse(self) -> None:
+        """Reverse the list in place.
+
+        Time Complexity:
+            O(n) where n is the number of elements (C-level reversal)
+        """
+        self._items.reverse()
+
+    def insert_at(self, index: int, value: T) -> None:
+        """Insert a value at the specified index.
+
+        Args:
+            index: The index at which to insert
+            value: The value to insert
+
+        Raises:
+            IndexOutOfBoundsError: If the index is out of bounds
+
+        Time Complexity:
+            O(n) where n is the number of elements
+        """
+        if not 0 <= index <= len(self._items):
+            raise IndexOutOfBoundsError(f"Index {index} out of bounds [0, {len(self._items)}]")
+        self._items.insert(index, value)
+
+    def remove_at(self, index: int) -> None:
+        """Remove the element at the specified index.
+
+        Args:
+            index: The index of the element to remove
+
+        Raises:
+            IndexOutOfBoundsError: If the index is out of bounds
+            EmptyListError: If the list is empty
+
+        Time Complexity:
+            O(n) where n is the number of elements
+        """
+        if not self._items:
+            raise EmptyListError("Cannot remove from empty list")
+        if not 0 <= index < len(self._items):
+            raise IndexOutOfBoundsError(f"Index {index} out of bounds [0, {len(self._items)})")
+        del self._items[index]
+
+    def __iter__(self) -> Iterator[T]:
+        """Return an iterator over the elements of the list.
+
+        Returns:
+            An iterator yielding each element in the list
+        """
+        return iter(self._items)
+
+    def __str__(self) -> str:
+        """Return a string representation of the list.
+
+        Returns:
+            A string showing the list's contents
+        """
+        if not self._items:
+            return "Empty List"
+        return " -> ".join(map(str, self._items)) + " -> None"
+
+
+class MyIntLinkedList:
+    """A linked list of integers stored in flat arrays instead of nodes.
+
+    Links are indices into a pair of array.array buffers — signed 64-bit
+    values and a parallel next-index array — with -1 standing in for
+    None. No node objects exist at all: an element costs 12 bytes of
+    packed machine words instead of a heap-allocated Python object plus
+    a boxed int, and freed slots are chained into an in-band free list
+    threaded through the next array, so deletions never shrink or shift
+    the buffers.
+
+    The API mirrors MyLinkedList, restricted to values that fit a signed
+    64-bit integer (array.array raises OverflowError otherwise).
+
+    Attributes:
+        _values: Packed element storage ('q', signed 64-bit)
+        _next: Index of each slot's successor, -1 for end of list ('l')
+        _head: Index of the first element, -1 when empty
+        _tail: Index of the last element, -1 when empty
+        _free: Head of the free-slot chain, -1 when no slot is free
+        _size: Current number of elements
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty integer linked list."""
+        self._values = array('q')
+        self._next = array('l')
+        self._head = -1
+        self._tail = -1
+        self._free = -1
+        self._size = 0
+
+    def _alloc(self, value: int) -> int:
+        """Claim a slot for value, reusing a freed slot when possible.
+
+        Args:
+            value: The integer to store
+
+        Returns:
+            The index of the slot holding value, with its next link reset
+        """
+        free = self._free
+        if free != -1:
+            self._free = self._next[free]
+            self._values[free] = value
+            self._next[free] = -1
+            return free
+        self._values.append(value)
+        self._next.append(-1)
+        return len(self._values) - 1
+
+    def _release(self, index: int) -> None:
+        """Return a slot to the free chain for reuse.
+
+        Args:
+            index: The slot to release; must already be unlinked
+        """
+        self._next[index] = self._free
+        self._free = index
+
+    def append(self, value: int) -> None:
+        """Append an integer to the end of the list.
+
+        Args:
+            value: The value to append
+
+        Time Complexity:
+            O(1) amortized
+        """
+        index = self._alloc(value)
+        if self._head == -1:
+            self._head = self._tail = index
+        else:
+            self._next[self._tail] = index
+            self._tail = index
+        self._size += 1
+
+    def prepend(self, value: int) -> None:
+        """Prepend an integer to the start of the list.
+
+        Args:
+            value: The value to prepend
+
+        Time Complexity:
+            O(1) amortized
+        """
+        index = self._alloc(value)
+        self._next[index] = self._head
+        self._head = index
+        if self._tail == -1:
+            self._tail = index
+        self._size += 1
+
+    def extend(self, values) -> None:
+        """Append every element of an iterable to the end of the list.
+
+        Args:
+            values: An iterable of integers to append
+
+        Time Complexity:
+            O(k) where k is the number of new elements
+        """
+        for value in values:
+            self.append(value)
+
+    def delete(self, value: int) -> bool:
+        """Delete the first occurrence of a value from the list.
+
+        Args:
+            value: The value to delete
+
+        Returns:
+            True if the value was found and deleted, False otherwise
+
+        Time Complexity:
+            O(n) where n is the number of elements
+        """
+        values = self._values
+        nexts = self._next
+        current = self._head
+        prev = -1
+        while current != -1 and values[current] != value:
+            prev = current
+            current = nexts[current]
+        if current == -1:
+            return False
+        if prev == -1:
+            self._head = nexts[current]
+        else:
+            nexts[prev] = nexts[current]
+        if current == self._tail:
+            self._tail = prev
+        self._size -= 1
+        self._release(current)
+        return True
+
+    def find(self, value: int) -> int:
+        """Find the index of the first occurrence of a value.
+
+        Args:
+            value: The value to find
+
+        Returns:
+            The position of the first occurrence, or -1 if not found
+
+        Time Complexity:
+            O(n) where n is the number of elements
+        """
+        values = self._values
+        nexts = self._next
+        current = self._head
+        position = 0
+        while current != -1:
+            if values[current] == value:
+                return position
+            current = nexts[current]
+            position += 1
+        return -1
+
+    def contains(self, value: int) -> bool:
+        """Check if the list contains a value.
+
+        Args:
+            value: The value to check for
+
+        Returns:
+            True if the value is in the list, False otherwise
+
+        Time Complexity:
+            O(n) where n is the number of elements
+        """
+        return self.find(value) != -1
+
+    def size(self) -> int:
+        """Get the number of elements in the list.
+
+        Returns:
+            The current size of the list
+
+        Time Complexity:
+            O(1)
+        """
+        return self._size
+
+    def is_empty(self) -> bool:
+        """Check if the list is empty.
+
+        Returns:
+            True if the list is empty, False otherwise
+
+        Time Complexity:
+            O(1)
+        """
+        return self._size == 0
+
+    def reverse(self) -> None:
+        """Reverse the list in place by relinking the index chain.
+
+        Time Complexity:
+            O(n) where n is the number of elements
+        """
+        nexts = self._next
+        current = self._head
+        self._tail = current
+        prev = -1
+        while current != -1:
+            following = nexts[current]
+            nexts[current] = prev
+            prev = current
+            current = following
+        self._head = prev
+
+    def insert_at(self, index: int, value: int) -> None:
+        """Insert a value at the specified index.
+
+        Args:
+            index: The index at which to insert
+            value: The value to insert
+
+        Raises:
+            IndexOutOfBoundsError: If the index is out of bounds
+
+        Time Complexity:
+            O(n) where n is the number of elements
+        """
+        if not 0 <= index <= self._size:
+            raise IndexOutOfBoundsError(f"Index {index} out of bounds [0, {self._size}]")
+        if index == 0:
+            self.prepend(value)
+            return
+        if index == self._size:
+            self.append(value)
+            return
+        nexts = self._next
+        current = self._head
+        for _ in range(index - 1):
+            current = nexts[current]
+        slot = self._alloc(value)
+        nexts[slot] = nexts[current]
+        nexts[current] = slot
+        self._size += 1
+
+    def remove_at(self, index: int) -> None:
+        """Remove the element at the specified index.
+
+        Args:
+            index: The index of the element to remove
+
+        Raises:
+            IndexOutOfBoundsError: If the index is out of bounds
+            EmptyListError: If the list is empty
+
+        Time Complexity:
+            O(n) where n is the number of elements
+        """
+        if self._size == 0:
+            raise EmptyListError("Cannot remove from empty list")
+        if not 0 <= index < self._size:
+            raise IndexOutOfBoundsError(f"Index {index} out of bounds [0, {self._size})")
+        nexts = self._next
+        if index == 0:
+            victim = self._head
+            self._head = nexts[victim]
+            if self._head == -1:
+                self._tail = -1
+            self._size -= 1
+            self._release(victim)
+            return
+        current = self._head
+        for _ in range(index - 1):
+            current = nexts[current]
+        victim = nexts[current]
+        nexts[current] = nexts[victim]
+        if victim == self._tail:
+            self._tail = current
+        self._size -= 1
+        self._release(victim)
+
+    def __iter__(self) -> Iterator[int]:
+        """Return an iterator over the elements of the list.
+
+        Returns:
+            An iterator yielding each element in the list
+        """
+        values = self._values
+        nexts = self._next
+        current = self._head
+        while current != -1:
+            yield values[current]
+            current = nexts[current]
+
+    def __str__(self) -> str:
+        """Return a string representation of the list.
+
+        Returns:
+            A string showing the list's contents
+        """
+        if self._head == -1:
+            return "Empty List"
+        parts: list = [None] * self._size
+        values = self._values
+        nexts = self._next
+        current = self._head
+        i = 0
+        while current != -1:
+            parts[i] = str(values[current])
+            current = nexts[current]
+            i += 1
+        return " -> ".join(parts) + " -> None"
 
 
 if __name__ == "__main__":
@@ -22,7 +22,8 @@ Example:
     >>> print(queue.dequeue())  # Output: 1
 """
 
-from typing import TypeVar, Generic, Iterator
+from collections import deque
+from typing import TypeVar, Generic, Iterator, Optional
 from dataclasses import dataclass
 from DataStructures.my_array import MyArray
 
@@ -60,6 +61,18 @@ class MyQueue(Generic[T]):
         """
         self.queue_array = MyArray[T](capacity)
         self.front_index = 0
+        # Cached element count: is_empty() and size() are often polled
+        # in hot consumer loops, and reading one own attribute beats the
+        # cross-object front_index/length arithmetic.
+        self._live = 0
+        # Monotonic candidate deques: _max_dq holds the live values in
+        # decreasing order, _min_dq in increasing order, so max()/min()
+        # read the front in O(1). Each element enters and leaves its
+        # deque at most once, keeping enqueue amortized O(1). Set to
+        # None the first time a value fails to compare, which disables
+        # the fast path in favour of the O(n) scan.
+        self._max_dq: Optional[deque] = deque()
+        self._min_dq: Optional[deque] = deque()
     
     def enqueue(self, value: T) -> None:
         """Add an element to the end of the queue.
@@ -71,7 +84,71 @@ class MyQueue(Generic[T]):
             O(1) amortized
         """
         self.queue_array.append(value)
-    
+        self._live += 1
+        self._track_enqueued(value)
+
+    def extend(self, values) -> None:
+        """Enqueue every element of an iterable in order.
+
+        Args:
+            values: An iterable of values to enqueue
+
+        Time Complexity:
+            O(k) where k is the number of new elements
+        """
+        vals = list(values)
+        self.queue_array.extend(vals)
+        self._live += len(vals)
+        for value in vals:
+            self._track_enqueued(value)
+
+    def _track_enqueued(self, value: T) -> None:
+        """Admit a newly enqueued value to the min/max candidate deques.
+
+        Args:
+            value: The value just appended to the backing array
+        """
+        max_dq = self._max_dq
+        if max_dq is None:
+            return
+        try:
+            while max_dq and max_dq[-1] < value:
+                max_dq.pop()
+            max_dq.append(value)
+            min_dq = self._min_dq
+            while min_dq and min_dq[-1] > value:
+                min_dq.pop()
+            min_dq.append(value)
+        except TypeError:
+            self._max_dq = None
+            self._min_dq = None
+
+    def _track_dequeued(self, value: T) -> None:
+        """Retire a dequeued value from the min/max candidate deques.
+
+        Args:
+            value: The value just removed from the front of the queue
+        """
+        max_dq = self._max_dq
+        if max_dq is None:
+            return
+        if max_dq[0] == value:
+            max_dq.popleft()
+        min_dq = self._min_dq
+        if min_dq[0] == value:
+            min_dq.popleft()
+
+    def _rebuild_minmax(self) -> None:
+        """Rebuild the min/max candidate deques from the live elements."""
+        max_dq = self._max_dq
+        if max_dq is None:
+            return
+        max_dq.clear()
+        self._min_dq.clear()
+        arr = self.queue_array
+        for value in arr.data[self.front_index:arr.length]:
+            self._track_enqueued(value)
+
     def dequeue(self) -> T:
         """Remove and return the front element from the queue.
         
@@ -88,7 +165,33 @@ class MyQueue(Generic[T]):
             raise EmptyQueueError("Cannot dequeue from empty queue")
         value = self.queue_array[self.front_index]
         self.front_index += 1
+        self._live -= 1
+        self._track_dequeued(value)
+        front = self.front_index
+        if front > 8 and front > self.queue_array.length - front:
+            self._compact()
         return value
+
+    def _compact(self) -> None:
+        """Shift the live elements back to the start of the backing array.
+
+        Dequeue only advances front_index, so the slots before it stay
+        occupied and would otherwise accumulate forever. Once the dead
+        prefix outweighs the live region this moves everything down with
+        a single slice assignment and releases the stale references.
+
+        Time Complexity:
+            O(n) where n is the number of live elements, amortized O(1)
+            per dequeue
+        """
+        arr = self.queue_array
+        front = self.front_index
+        length = arr.length
+        live = length - front
+        arr.data[0:live] = arr.data[front:length]
+        arr.data[live:length] = [arr._fill] * front
+        arr.length = live
+        self.front_index = 0
     
     def peek(self) -> T:
         """Get the front element without removing it.
@@ -115,7 +218,7 @@ class MyQueue(Generic[T]):
         Time Complexity:
             O(1)
         """
-        return self.front_index >= self.queue_array.length
+        return self._live == 0
     
     def size(self) -> int:
         """Get the number of elements in the queue.
@@ -126,7 +229,7 @@ class MyQueue(Generic[T]):
         Time Complexity:
             O(1)
         """
-        return self.queue_array.length - self.front_index
+        return self._live
     
     def reverse(self) -> None:
         """Reverse the queue in place.
@@ -134,15 +237,11 @@ class MyQueue(Generic[T]):
         Time Complexity:
             O(n) where n is the number of elements
         """
-        left = self.front_index
-        right = self.queue_array.length - 1
-        while left < right:
-            self.queue_array[left], self.queue_array[right] = (
-                self.queue_array[right],
-                self.queue_array[left],
-            )
-            left += 1
-            right -= 1
+        arr = self.queue_array
+        front = self.front_index
+        arr.data[front:arr.length] = arr.data[front:arr.length][::-1]
+        # The candidate deques track arrival order, which just changed.
+        self._rebuild_minmax()
     
     def max(self) -> T:
         """Get the maximum value in the queue.
@@ -152,13 +251,17 @@ class MyQueue(Generic[T]):
             
         Raises:
             EmptyQueueError: If the queue is empty
-            
+
         Time Complexity:
-            O(n) where n is the number of elements
+            O(1) amortized, O(n) for values that do not compare
         """
         if self.is_empty():
             raise EmptyQueueError("Cannot get max from empty queue")
-        return max(self.queue_array[i] for i in range(self.front_index, self.queue_array.length))
+        max_dq = self._max_dq
+        if max_dq is not None:
+            return max_dq[0]
+        arr = self.queue_array
+        return max(arr.data[self.front_index:arr.length])
     
     def min(self) -> T:
         """Get the minimum value in the queue.
@@ -168,17 +271,52 @@ class MyQueue(Generic[T]):
             
         Raises:
             EmptyQueueError: If the queue is empty
-            
+
         Time Complexity:
-            O(n) where n is the number of elements
+            O(1) amortized, O(n) for values that do not compare
         """
         if self.is_empty():
             raise EmptyQueueError("Cannot get min from empty queue")
-        return min(self.queue_array[i] for i in range(self.front_index, self.queue_array.length))
+        min_dq = self._min_dq
+        if min_dq is not None:
+            return min_dq[0]
+        arr = self.queue_array
+        return min(arr.data[self.front_index:arr.length])
     
+    def to_list(self) -> list:
+        """Convert the queue to a Python list in one bulk copy.
+
+        Returns:
+            A list of the queue's elements, front to back
+
+        Time Complexity:
+            O(n) where n is the number of elements (single slice copy)
+        """
+        arr = self.queue_array
+        return arr.data[self.front_index:arr.length]
+
+    @classmethod
+    def from_iterable(cls, values) -> 'MyQueue[T]':
+        """Build a queue from an iterable in one bulk copy.
+
+        Args:
+            values: An iterable of values to enqueue, front first
+
+        Returns:
+            A new queue containing the values in order
+
+        Time Complexity:
+            O(n) where n is the number of elements
+        """
+        queue = cls()
+        queue.queue_array = MyArray.from_iterable(values)
+        queue._live = queue.queue_array.length
+        queue._rebuild_minmax()
+        return queue
+
     def __iter__(self) -> Iterator[T]:
         """Return an iterator over the elements of the queue.
-        
+
         Returns:
             An iterator yielding each element in the queue (front to back)
         """
@@ -193,8 +331,196 @@ class MyQueue(Generic[T]):
         """
         if self.is_empty():
             return "Empty Queue"
+        arr = self.queue_array
         return "Queue(front -> back): [" + ", ".join(
-            str(self.queue_array[i]) for i in range(self.front_index, self.queue_array.length)) + "]"
+            map(str, arr.data[self.front_index:arr.length])) + "]"
+
+
+class FastQueue(MyQueue[T]):
+    """A queue that delegates storage to collections.deque.
+
+    MyQueue implements the cursor-plus-compaction scheme in Python to
+    show how an array-backed queue works; deque is a C-implemented block
+    list with true O(1) popleft, no slack to reclaim and no amortization
+    spikes. This subclass keeps the MyQueue API but routes every
+    operation through an internal deque, so callers who need throughput
+    rather than the teaching internals can switch classes without
+    touching their code.
+
+    Type Parameters:
+        T: The type of elements stored in the queue
+    """
+
+    def __init__(self, capacity: int = 4) -> None:
+        """Initialize an empty queue.
+
+        Args:
+            capacity: Accepted for API compatibility; the deque manages
+                its own block allocation (default: 4)
+        """
+        self._dq: deque = deque()
+
+    def enqueue(self, value: T) -> None:
+        """Add an element to the end of the queue.
+
+        Args:
+            value: The value to enqueue
+
+        Time Complexity:
+            O(1)
+        """
+        self._dq.append(value)
+
+    def extend(self, values) -> None:
+        """Enqueue every element of an iterable in order.
+
+        Args:
+            values: An iterable of values to enqueue
+
+        Time Complexity:
+            O(k) where k is the number of new elements
+        """
+        self._dq.extend(values)
+
+    def dequeue(self) -> T:
+        """Remove and return the front element from the queue.
+
+        Returns:
+            The front element
+
+        Raises:
+            EmptyQueueError: If the queue is empty
+
+        Time Complexity:
+            O(1)
+        """
+        if not self._dq:
+            raise EmptyQueueError("Cannot dequeue from empty queue")
+        return self._dq.popleft()
+
+    def peek(self) -> T:
+        """Get the front element without removing it.
+
+        Returns:
+            The front element
+
+        Raises:
+            EmptyQueueError: If the queue is empty
+
+        Time Complexity:
+            O(1)
+        """
+        if not self._dq:
+            raise EmptyQueueError("Cannot peek from empty queue")
+        return self._dq[0]
+
+    def is_empty(self) -> bool:
+        """Check if the queue is empty.
+
+        Returns:
+            True if the queue is empty, False otherwise
+
+        Time Complexity:
+            O(1)
+        """
+        return not self._dq
+
+    def size(self) -> int:
+        """Get the number of elements in the queue.
+
+        Returns:
+            The current size of the queue
+
+        Time Complexity:
+            O(1)
+        """
+        return len(self._dq)
+
+    def reverse(self) -> None:
+        """Reverse the queue in place.
+
+        Time Complexity:
+            O(n) where n is the number of elements (C-level reversal)
+        """
+        self._dq.reverse()
+
+    def max(self) -> T:
+        """Get the maximum value in the queue.
+
+        Returns:
+            The maximum value
+
+        Raises:
+            EmptyQueueError: If the queue is empty
+
+        Time Complexity:
+            O(n) where n is the number of elements (C-level scan)
+        """
+        if not self._dq:
+            raise EmptyQueueError("Cannot get max from empty queue")
+        return max(self._dq)
+
+    def min(self) -> T:
+        """Get the minimum value in the queue.
+
+        Returns:
+            The minimum value
+
+        Raises:
+            EmptyQueueError: If the queue is empty
+
+        Time Complexity:
+            O(n) where n is the number of elements (C-level scan)
+        """
+        if not self._dq:
+            raise EmptyQueueError("Cannot get min from empty queue")
+        return min(self._dq)
+
+    def to_list(self) -> list:
+        """Convert the queue to a Python list in one bulk copy.
+
+        Returns:
+            A list of the queue's elements, front to back
+
+        Time Complexity:
+            O(n) where n is the number of elements
+        """
+        return list(self._dq)
+
+    @classmethod
+    def from_iterable(cls, values) -> 'FastQueue[T]':
+        """Build a queue from an iterable in one bulk copy.
+
+        Args:
+            values: An iterable of values to enqueue, front first
+
+        Returns:
+            A new queue containing the values in order
+
+        Time Complexity:
+            O(n) where n is the number of elements
+        """
+        queue = cls()
+        queue._dq = deque(values)
+        return queue
+
+    def __iter__(self) -> Iterator[T]:
+        """Return an iterator over the elements of the queue.
+
+        Returns:
+            An iterator yielding each element in the queue (front to back)
+        """
+        return iter(self._dq)
+
+    def __str__(self) -> str:
+        """Return a string representation of the queue.
+
+        Returns:
+            A string showing the queue's contents (front to back)
+        """
+        if not self._dq:
+            return "Empty Queue"
+        return "Queue(front -> back): [" + ", ".join(map(str, self._dq)) + "]"
 
 
 if __name__ == "__main__":
@@ -265,5 +591,15 @@ if __name__ == "__main__":
             queue.enqueue("string")  # Type error
         except TypeError as e:
             print(f"Expected error: {e}")
+
+        # Test FastQueue
+        print("\nTesting FastQueue:")
+        fast = FastQueue[int]()
+        fast.extend([4, 1, 9, 2])
+        print(f"FastQueue: {fast}")
+        print(f"Dequeued: {fast.dequeue()}")
+        print(f"Max: {fast.max()}, Min: {fast.min()}")
+        fast.reverse()
+        print(f"After reverse: {fast}")
     
     test_queue()
@@ -0,0 +1,278 @@
+"""A skip list implementation with type safety and comprehensive error handling.
+
+This module provides a sorted skip list that keeps its elements ordered and
+reaches any of them in O(log n) expected time. Each node carries a tower of
+forward pointers; a node's height is drawn from a geometric distribution, so
+the express lanes thin out roughly by half per level and a search skips over
+large runs of the base list. Every forward pointer also stores the number of
+base-level links it jumps (its span), which makes the list indexable: the
+k-th smallest element is found by walking spans instead of nodes.
+
+Features:
+- O(log n) expected insert, delete, search and index access
+- Duplicate values allowed (kept adjacent)
+- Type safety with type hints
+- Iterator support over the sorted order
+
+Example:
+    >>> sl = MySkipList[int]()
+    >>> sl.insert(3)
+    >>> sl.insert(1)
+    >>> sl.insert(2)
+    >>> sl.find(2)
+    True
+    >>> sl.get_at(0)
+    1
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TypeVar, Generic, Iterator, List, Optional
+
+T = TypeVar('T')
+
+
+class SkipListError(Exception):
+    """Base exception class for skip list errors."""
+    pass
+
+
+class EmptySkipListError(SkipListError):
+    """Raised when attempting operations on an empty skip list."""
+    pass
+
+
+class ValueNotFoundError(SkipListError):
+    """Raised when a value is not found in the skip list."""
+    pass
+
+
+class SkipNode(Generic[T]):
+    """A node in the skip list.
+
+    Attributes:
+        value: The value stored in the node
+        forward: Forward pointer for each level the node participates in
+        span: Number of base-level links each forward pointer jumps over
+    """
+
+    __slots__ = ('value', 'forward', 'span')
+
+    def __init__(self, value: Optional[T], height: int) -> None:
+        self.value = value
+        self.forward: List[Optional['SkipNode[T]']] = [None] * height
+        self.span: List[int] = [0] * height
+
+
+class MySkipList(Generic[T]):
+    """A sorted, indexable skip list.
+
+    Values are kept in ascending order. Node heights are randomized with
+    probability 1/2 per extra level, capped at MAX_LEVEL.
+
+    Attributes:
+        size: Number of elements in the list
+
+    Time Complexity:
+        - Insert: O(log n) expected
+        - Delete: O(log n) expected
+        - Find: O(log n) expected
+        - Index access: O(log n) expected
+    """
+
+    MAX_LEVEL = 16
+
+    def __init__(self) -> None:
+        """Initialize an empty skip list."""
+        self._head: SkipNode[T] = SkipNode(None, self.MAX_LEVEL)
+        self._level = 1
+        self.size = 0
+
+    def _random_height(self) -> int:
+        """Draw a node height from a geometric distribution.
+
+        Returns:
+            int: A height between 1 and MAX_LEVEL
+        """
+        height = 1
+        while height < self.MAX_LEVEL and random.getrandbits(1):
+            height += 1
+        return height
+
+    def insert(self, value: T) -> None:
+        """Insert a value, keeping the list sorted.
+
+        Args:
+            value: The value to insert
+
+        Time Complexity: O(log n) expected
+        """
+        update: List[SkipNode[T]] = [self._head] * self.MAX_LEVEL
+        rank = [0] * self.MAX_LEVEL
+        node = self._head
+        steps = 0
+        for lvl in range(self._level - 1, -1, -1):
+            nxt = node.forward[lvl]
+            while nxt is not None and nxt.value < value:
+                steps += node.span[lvl]
+                node = nxt
+                nxt = node.forward[lvl]
+            rank[lvl] = steps
+            update[lvl] = node
+
+        height = self._random_height()
+        if height > self._level:
+            for lvl in range(self._level, height):
+                rank[lvl] = 0
+                update[lvl] = self._head
+                self._head.span[lvl] = self.size
+            self._level = height
+
+        new_node = SkipNode(value, height)
+        for lvl in range(height):
+            prev = update[lvl]
+            new_node.forward[lvl] = prev.forward[lvl]
+            prev.forward[lvl] = new_node
+            new_node.span[lvl] = prev.span[lvl] - (rank[0] - rank[lvl])
+            prev.span[lvl] = rank[0] - rank[lvl] + 1
+        for lvl in range(height, self._level):
+            update[lvl].span[lvl] += 1
+        self.size += 1
+
+    def delete(self, value: T) -> None:
+        """Delete the first occurrence of a value.
+
+        Args:
+            value: The value to delete
+
+        Raises:
+            EmptySkipListError: If the list is empty
+            ValueNotFoundError: If the value is not found
+
+        Time Complexity: O(log n) expected
+        """
+        if self.size == 0:
+            raise EmptySkipListError("Cannot delete from empty skip list")
+
+        update: List[SkipNode[T]] = [self._head] * self.MAX_LEVEL
+        node = self._head
+        for lvl in range(self._level - 1, -1, -1):
+            nxt = node.forward[lvl]
+            while nxt is not None and nxt.value < value:
+                node = nxt
+                nxt = node.forward[lvl]
+            update[lvl] = node
+
+        target = node.forward[0]
+        if target is None or target.value != value:
+            raise ValueNotFoundError(f"Value {value} not found in skip list")
+
+        for lvl in range(self._level):
+            prev = update[lvl]
+            if prev.forward[lvl] is target:
+                prev.span[lvl] += target.span[lvl] - 1
+                prev.forward[lvl] = target.forward[lvl]
+            else:
+                prev.span[lvl] -= 1
+        while self._level > 1 and self._head.forward[self._level - 1] is None:
+            self._level -= 1
+        self.size -= 1
+
+    def find(self, value: T) -> bool:
+        """Check whether a value is in the list.
+
+        Args:
+            value: The value to search for
+
+        Returns:
+            bool: True if the value is present, False otherwise
+
+        Time Complexity: O(log n) expected
+        """
+        node = self._head
+        for lvl in range(self._level - 1, -1, -1):
+            nxt = node.forward[lvl]
+            while nxt is not None and nxt.value < value:
+                node = nxt
+                nxt = node.forward[lvl]
+        candidate = node.forward[0]
+        return candidate is not None and candidate.value == value
+
+    def get_at(self, index: int) -> T:
+        """Get the value at a given rank in sorted order.
+
+        Args:
+            index: Zero-based rank of the value to return
+
+        Returns:
+            The index-th smallest value
+
+        Raises:
+            SkipListError: If the index is out of range
+
+        Time Complexity: O(log n) expected
+        """
+        if index < 0 or index >= self.size:
+            raise SkipListError(f"Index {index} out of range")
+        node = self._head
+        remaining = index + 1
+        for lvl in range(self._level - 1, -1, -1):
+            while node.forward[lvl] is not None and node.span[lvl] <= remaining:
+                remaining -= node.span[lvl]
+                node = node.forward[lvl]
+        return node.value
+
+    def is_empty(self) -> bool:
+        """Check if the skip list is empty.
+
+        Returns:
+            bool: True if the list is empty, False otherwise
+        """
+        return self.size == 0
+
+    def to_list(self) -> List[T]:
+        """Convert the skip list to a sorted Python list.
+
+        Returns:
+            List[T]: Values in ascending order
+        """
+        return list(self)
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over values in ascending order."""
+        node = self._head.forward[0]
+        while node is not None:
+            yield node.value
+            node = node.forward[0]
+
+    def __len__(self) -> int:
+        """Return the number of elements in the list."""
+        return self.size
+
+    def __str__(self) -> str:
+        """Return a string representation of the skip list."""
+        return " -> ".join(map(str, self))
+
+
+def test_skip_list():
+    """Test function demonstrating skip list usage."""
+    sl = MySkipList[int]()
+    for value in [5, 1, 9, 3, 7, 3]:
+        sl.insert(value)
+    print(f"Skip list: {sl}")
+    print(f"Size: {len(sl)}")
+    print(f"Find 7: {sl.find(7)}")
+    print(f"Find 4: {sl.find(4)}")
+    print(f"Value at rank 0: {sl.get_at(0)}")
+    print(f"Value at rank 3: {sl.get_at(3)}")
+    sl.delete(3)
+    print(f"After deleting 3: {sl}")
+    try:
+        sl.delete(42)
+    except ValueNotFoundError as error:
+        print(f"Error: {error}")
+
+
+if __name__ == "__main__":
+    test_skip_list()
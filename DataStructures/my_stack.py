@@ -1,8 +1,8 @@
 """A stack implementation using a dynamic array.
 
 This module provides a stack implementation with comprehensive features
-and type safety. The stack is implemented using a dynamic array for
-efficient operations.
+and type safety. The stack is backed directly by a built-in list, so the
+hot operations run as single C-level calls.
 
 Features:
 - O(1) push and pop operations
@@ -22,172 +22,560 @@ Example:
     >>> print(stack.pop())   # Output: 2
 """
 
+from array import array
 from typing import TypeVar, Generic, Iterator, Optional
-from dataclasses import dataclass
-from DataStructures.my_array import MyArray
 
 T = TypeVar('T')
 
-@dataclass
 class StackError(Exception):
     """Base exception class for stack operations."""
-    message: str
+    __slots__ = ()
 
 class EmptyStackError(StackError):
     """Raised when trying to perform operations on an empty stack."""
-    pass
+    __slots__ = ()
 
 class MyStack(Generic[T]):
     """A stack implementation using a dynamic array.
-    
+
     This class provides a stack implementation with comprehensive features
-    and type safety. It uses a dynamic array for efficient operations.
-    
+    and type safety. It stores elements in a built-in list, bottom to top,
+    so push and pop delegate straight to list.append/list.pop in C.
+
     Attributes:
-        stack_array: The underlying dynamic array
-        _capacity: Initial capacity of the stack
-    
+        _data: The underlying list holding elements, bottom to top
+
     Type Parameters:
         T: The type of elements stored in the stack
     """
-    
+
+    __slots__ = ('_data', '_min_stack', '_max_stack')
+
     def __init__(self, capacity: int = 4) -> None:
         """Initialize an empty stack.
-        
+
         Args:
-            capacity: Initial capacity of the stack (default: 4)
+            capacity: Accepted for API compatibility; the list manages
+                its own growth (default: 4)
         """
-        self.stack_array = MyArray[T](capacity)
-    
+        self._data: list = []
+        # Running-extremum stacks: entry i holds the min/max of the
+        # first i+1 elements, so min()/max() peek the top in O(1). Set
+        # to None the first time a value fails to compare, which
+        # disables the fast path in favour of the O(n) scan.
+        self._min_stack: Optional[list] = []
+        self._max_stack: Optional[list] = []
+
     def push(self, value: T) -> None:
         """Push an element onto the stack.
-        
+
         Args:
             value: The value to push
-            
+
         Time Complexity:
             O(1) amortized
         """
-        self.stack_array.append(value)
-    
+        self._data.append(value)
+        self._track_pushed(value)
+
+    def extend(self, values) -> None:
+        """Push every element of an iterable in order.
+
+        The last element of the iterable ends up on top of the stack,
+        exactly as if each value had been pushed individually.
+
+        Args:
+            values: An iterable of values to push
+
+        Time Complexity:
+            O(k) where k is the number of new elements (C-level extend)
+        """
+        vals = list(values)
+        self._data.extend(vals)
+        for value in vals:
+            self._track_pushed(value)
+
+    def push_many(self, values) -> None:
+        """Push every element of an iterable in one batch call.
+
+        Alias of extend(): the last element ends up on top.
+
+        Args:
+            values: An iterable of values to push
+
+        Time Complexity:
+            O(k) where k is the number of new elements
+        """
+        self.extend(values)
+
+    def pop_many(self, count: int) -> list:
+        """Pop several elements in one batch call.
+
+        Args:
+            count: The number of elements to pop
+
+        Returns:
+            The popped elements in pop order (top of the stack first)
+
+        Raises:
+            StackError: If count is negative
+            EmptyStackError: If the stack holds fewer than count elements
+
+        Time Complexity:
+            O(k) where k is the number of popped elements (one slice
+            copy and one C-level truncation)
+        """
+        if count < 0:
+            raise StackError(f"Cannot pop a negative count ({count})")
+        if count == 0:
+            return []
+        data = self._data
+        if count > len(data):
+            raise EmptyStackError(
+                f"Cannot pop {count} elements from stack of size {len(data)}")
+        popped = data[-count:][::-1]
+        del data[-count:]
+        if self._min_stack is not None:
+            del self._min_stack[-count:]
+            del self._max_stack[-count:]
+        return popped
+
+    def _track_pushed(self, value: T) -> None:
+        """Record a pushed value in the running min/max stacks.
+
+        Args:
+            value: The value just appended to the backing list
+        """
+        min_stack = self._min_stack
+        if min_stack is None:
+            return
+        try:
+            if min_stack:
+                current_min = min_stack[-1]
+                current_max = self._max_stack[-1]
+                min_stack.append(value if value < current_min else current_min)
+                self._max_stack.append(value if value > current_max else current_max)
+            else:
+                min_stack.append(value)
+                self._max_stack.append(value)
+        except TypeError:
+            self._min_stack = None
+            self._max_stack = None
+
+    def _rebuild_minmax(self) -> None:
+        """Rebuild the running min/max stacks from the elements."""
+        min_stack = self._min_stack
+        if min_stack is None:
+            return
+        min_stack.clear()
+        self._max_stack.clear()
+        for value in self._data:
+            self._track_pushed(value)
+
     def pop(self) -> T:
         """Pop the top element from the stack.
-        
+
         Returns:
             The top element
-            
+
         Raises:
             EmptyStackError: If the stack is empty
-            
+
         Time Complexity:
             O(1) amortized
         """
-        if self.is_empty():
-            raise EmptyStackError("Cannot pop from empty stack")
-        return self.stack_array.pop()
-    
+        # EAFP: the common case pays no emptiness check; an empty stack
+        # surfaces as the list's IndexError and is translated.
+        try:
+            value = self._data.pop()
+        except IndexError:
+            raise EmptyStackError("Cannot pop from empty stack") from None
+        if self._min_stack is not None:
+            self._min_stack.pop()
+            self._max_stack.pop()
+        return value
+
     def peek(self) -> T:
         """Get the top element without removing it.
-        
+
         Returns:
             The top element
-            
+
         Raises:
             EmptyStackError: If the stack is empty
-            
+
         Time Complexity:
             O(1)
         """
-        if self.is_empty():
-            raise EmptyStackError("Cannot peek from empty stack")
-        return self.stack_array[self.stack_array.length - 1]
-    
+        try:
+            return self._data[-1]
+        except IndexError:
+            raise EmptyStackError("Cannot peek from empty stack") from None
+
     def is_empty(self) -> bool:
         """Check if the stack is empty.
-        
+
         Returns:
             True if the stack is empty, False otherwise
-            
+
         Time Complexity:
             O(1)
         """
-        return self.stack_array.length == 0
-    
+        return not self._data
+
     def size(self) -> int:
         """Get the number of elements in the stack.
-        
+
         Returns:
             The current size of the stack
-            
+
         Time Complexity:
             O(1)
         """
-        return self.stack_array.length
-    
+        return len(self._data)
+
     def reverse(self) -> None:
         """Reverse the stack in place.
-        
+
         Time Complexity:
-            O(n) where n is the number of elements
+            O(n) where n is the number of elements (C-level reversal)
         """
-        n = self.stack_array.length
-        for i in range(n // 2):
-            self.stack_array[i], self.stack_array[n - i - 1] = (
-                self.stack_array[n - i - 1],
-                self.stack_array[i],
-            )
-    
+        self._data.reverse()
+        # The running extrema track push order, which just changed.
+        self._rebuild_minmax()
+
     def max(self) -> T:
         """Get the maximum value in the stack.
-        
+
         Returns:
             The maximum value
-            
+
         Raises:
             EmptyStackError: If the stack is empty
-            
+
         Time Complexity:
-            O(n) where n is the number of elements
+            O(1), O(n) for values that do not compare
         """
-        if self.is_empty():
+        if not self._data:
             raise EmptyStackError("Cannot get max from empty stack")
-        return max(self.stack_array[i] for i in range(self.stack_array.length))
-    
+        max_stack = self._max_stack
+        if max_stack is not None:
+            return max_stack[-1]
+        return max(self._data)
+
     def min(self) -> T:
         """Get the minimum value in the stack.
-        
+
         Returns:
             The minimum value
-            
+
         Raises:
             EmptyStackError: If the stack is empty
-            
+
         Time Complexity:
-            O(n) where n is the number of elements
+            O(1), O(n) for values that do not compare
         """
-        if self.is_empty():
+        if not self._data:
             raise EmptyStackError("Cannot get min from empty stack")
-        return min(self.stack_array[i] for i in range(self.stack_array.length))
-    
+        min_stack = self._min_stack
+        if min_stack is not None:
+            return min_stack[-1]
+        return min(self._data)
+
+    def to_list(self) -> list:
+        """Convert the stack to a Python list in one bulk copy.
+
+        Returns:
+            A list of the stack's elements, bottom to top
+
+        Time Complexity:
+            O(n) where n is the number of elements (single copy)
+        """
+        return self._data[:]
+
+    @classmethod
+    def from_iterable(cls, values) -> 'MyStack[T]':
+        """Build a stack from an iterable in one bulk copy.
+
+        Args:
+            values: An iterable of values to push, bottom first
+
+        Returns:
+            A new stack containing the values, with the last on top
+
+        Time Complexity:
+            O(n) where n is the number of elements
+        """
+        stack = cls()
+        stack._data = list(values)
+        stack._rebuild_minmax()
+        return stack
+
+    def __len__(self) -> int:
+        """Return the number of elements in the stack."""
+        return len(self._data)
+
+    def __length_hint__(self) -> int:
+        """Return the exact element count so consumers preallocate once."""
+        return len(self._data)
+
     def __iter__(self) -> Iterator[T]:
         """Return an iterator over the elements of the stack.
-        
+
         Returns:
             An iterator yielding each element in the stack (top to bottom)
         """
-        for i in reversed(range(self.stack_array.length)):
-            yield self.stack_array[i]
-    
+        return reversed(self._data)
+
     def __str__(self) -> str:
         """Return a string representation of the stack.
-        
+
         Returns:
             A string showing the stack's contents (top to bottom)
         """
-        if self.is_empty():
+        if not self._data:
             return "Empty Stack"
-        return "Stack(top -> bottom): [" + ", ".join(
-            str(self.stack_array[i]) for i in reversed(range(self.stack_array.length))) + "]"
+        # list.__repr__ formats every element in one C call; elements
+        # render with repr(), so strings gain quotes.
+        return f"Stack(top -> bottom): {self._data[::-1]}"
+
+
+class MyIntStack:
+    """A stack of integers stored in a packed array.array buffer.
+
+    MyStack keeps a PyObject* per element; for integer workloads this
+    variant stores raw signed 64-bit machine words instead, cutting
+    memory to 8 bytes per element and keeping scans cache-friendly.
+    Values must fit a signed 64-bit integer (array.array raises
+    OverflowError otherwise). The API mirrors MyStack.
+
+    Attributes:
+        _data: Packed element storage ('q'), bottom to top
+    """
+
+    __slots__ = ('_data',)
+
+    def __init__(self, capacity: int = 4) -> None:
+        """Initialize an empty integer stack.
+
+        Args:
+            capacity: Accepted for API compatibility; the array manages
+                its own growth (default: 4)
+        """
+        self._data = array('q')
+
+    def push(self, value: int) -> None:
+        """Push an integer onto the stack.
+
+        Args:
+            value: The value to push
+
+        Time Complexity:
+            O(1) amortized
+        """
+        self._data.append(value)
+
+    def extend(self, values) -> None:
+        """Push every element of an iterable in order.
+
+        Args:
+            values: An iterable of integers to push
+
+        Time Complexity:
+            O(k) where k is the number of new elements
+        """
+        self._data.extend(values)
+
+    def push_many(self, values) -> None:
+        """Push every element of an iterable in one batch call.
+
+        Alias of extend(): the last element ends up on top.
+
+        Args:
+            values: An iterable of integers to push
+
+        Time Complexity:
+            O(k) where k is the number of new elements
+        """
+        self.extend(values)
+
+    def pop_many(self, count: int) -> list:
+        """Pop several elements in one batch call.
+
+        Args:
+            count: The number of elements to pop
+
+        Returns:
+            The popped elements in pop order (top of the stack first)
+
+        Raises:
+            StackError: If count is negative
+            EmptyStackError: If the stack holds fewer than count elements
+
+        Time Complexity:
+            O(k) where k is the number of popped elements
+        """
+        if count < 0:
+            raise StackError(f"Cannot pop a negative count ({count})")
+        if count == 0:
+            return []
+        data = self._data
+        if count > len(data):
+            raise EmptyStackError(
+                f"Cannot pop {count} elements from stack of size {len(data)}")
+        popped = data[-count:][::-1].tolist()
+        del data[-count:]
+        return popped
+
+    def pop(self) -> int:
+        """Pop the top element from the stack.
+
+        Returns:
+            The top element
+
+        Raises:
+            EmptyStackError: If the stack is empty
+
+        Time Complexity:
+            O(1) amortized
+        """
+        try:
+            return self._data.pop()
+        except IndexError:
+            raise EmptyStackError("Cannot pop from empty stack") from None
+
+    def peek(self) -> int:
+        """Get the top element without removing it.
+
+        Returns:
+            The top element
+
+        Raises:
+            EmptyStackError: If the stack is empty
+
+        Time Complexity:
+            O(1)
+        """
+        try:
+            return self._data[-1]
+        except IndexError:
+            raise EmptyStackError("Cannot peek from empty stack") from None
+
+    def is_empty(self) -> bool:
+        """Check if the stack is empty.
+
+        Returns:
+            True if the stack is empty, False otherwise
+
+        Time Complexity:
+            O(1)
+        """
+        return not self._data
+
+    def size(self) -> int:
+        """Get the number of elements in the stack.
+
+        Returns:
+            The current size of the stack
+
+        Time Complexity:
+            O(1)
+        """
+        return len(self._data)
+
+    def reverse(self) -> None:
+        """Reverse the stack in place.
+
+        Time Complexity:
+            O(n) where n is the number of elements (C-level reversal)
+        """
+        self._data.reverse()
+
+    def max(self) -> int:
+        """Get the maximum value in the stack.
+
+        Returns:
+            The maximum value
+
+        Raises:
+            EmptyStackError: If the stack is empty
+
+        Time Complexity:
+            O(n) where n is the number of elements (C-level scan)
+        """
+        if not self._data:
+            raise EmptyStackError("Cannot get max from empty stack")
+        return max(self._data)
+
+    def min(self) -> int:
+        """Get the minimum value in the stack.
+
+        Returns:
+            The minimum value
+
+        Raises:
+            EmptyStackError: If the stack is empty
+
+        Time Complexity:
+            O(n) where n is the number of elements (C-level scan)
+        """
+        if not self._data:
+            raise EmptyStackError("Cannot get min from empty stack")
+        return min(self._data)
+
+    def to_list(self) -> list:
+        """Convert the stack to a Python list in one bulk copy.
+
+        Returns:
+            A list of the stack's elements, bottom to top
+
+        Time Complexity:
+            O(n) where n is the number of elements (single conversion)
+        """
+        return self._data.tolist()
+
+    @classmethod
+    def from_iterable(cls, values) -> 'MyIntStack':
+        """Build a stack from an iterable in one bulk copy.
+
+        Args:
+            values: An iterable of integers to push, bottom first
+
+        Returns:
+            A new stack containing the values, with the last on top
+
+        Time Complexity:
+            O(n) where n is the number of elements
+        """
+        stack = cls()
+        stack._data = array('q', values)
+        return stack
+
+    def __len__(self) -> int:
+        """Return the number of elements in the stack."""
+        return len(self._data)
+
+    def __length_hint__(self) -> int:
+        """Return the exact element count so consumers preallocate once."""
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[int]:
+        """Return an iterator over the elements of the stack.
+
+        Returns:
+            An iterator yielding each element in the stack (top to bottom)
+        """
+        return reversed(self._data)
+
+    def __str__(self) -> str:
+        """Return a string representation of the stack.
+
+        Returns:
+            A string showing the stack's contents (top to bottom)
+        """
+        if not self._data:
+            return "Empty Stack"
+        return f"Stack(top -> bottom): {self._data[::-1].tolist()}"
 
 
 if __name__ == "__main__":
@@ -196,44 +584,44 @@ if __name__ == "__main__":
         # Create a stack
         stack = MyStack[int]()
         print("Created empty stack")
-        
+
         # Test push
         print("\nTesting push:")
         for i in [5, 10, 3, 7]:
             stack.push(i)
             print(f"Pushed {i}: {stack}")
-        
+
         # Test peek
         print("\nTesting peek:")
         print(f"Top element: {stack.peek()}")
-        
+
         # Test pop
         print("\nTesting pop:")
         print(f"Popped: {stack.pop()}")
         print(f"After pop: {stack}")
-        
+
         # Test max and min
         print("\nTesting max and min:")
         print(f"Max: {stack.max()}")
         print(f"Min: {stack.min()}")
-        
+
         # Test reverse
         print("\nTesting reverse:")
         stack.reverse()
         print(f"After reverse: {stack}")
-        
+
         # Test iteration
         print("\nTesting iteration:")
         print("Elements (top to bottom):", end=" ")
         for x in stack:
             print(x, end=" ")
         print()
-        
+
         # Test size and is_empty
         print("\nTesting size and is_empty:")
         print(f"Size: {stack.size()}")
         print(f"Is empty: {stack.is_empty()}")
-        
+
         # Test error handling
         print("\nTesting error handling:")
         empty = MyStack[int]()
@@ -241,22 +629,22 @@ if __name__ == "__main__":
             empty.pop()  # Empty stack
         except EmptyStackError as e:
             print(f"Expected error: {e}")
-        
+
         try:
             empty.peek()  # Empty stack
         except EmptyStackError as e:
             print(f"Expected error: {e}")
-        
+
         try:
             empty.max()  # Empty stack
         except EmptyStackError as e:
             print(f"Expected error: {e}")
-        
+
         # Test type safety
         print("\nTesting type safety:")
         try:
             stack.push("string")  # Type error
         except TypeError as e:
             print(f"Expected error: {e}")
-    
+
     test_stack()